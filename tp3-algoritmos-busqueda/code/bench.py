@@ -0,0 +1,133 @@
+# Micro-benchmark de los algoritmos de búsqueda
+#
+# Por cada (algoritmo, semilla, cost_mode): `warmup` corridas descartadas y
+# después `repeats` corridas medidas con el GC apagado (se hace gc.collect()
+# antes de cada una). El mapa y la Grid se arman una sola vez por semilla.
+# Se reporta mediana, p95, IQR y ops/s (= 1 / mediana).
+#
+#   python bench.py --algos astar,ucs --n_envs 5 --save ../bench_baseline.json
+#   python bench.py --algos astar,ucs --n_envs 5 --compare ../bench_baseline.json
+#
+# --compare marca regresión si la mediana empeora más de --threshold y además
+# los IQR no se solapan (p25 nuevo > p75 base); sale con código 1 si hay alguna.
+
+import gc, json, time, platform, argparse, statistics, sys
+
+from main import ALGORITHMS, MAP_KINDS, MAP_SIZE, P_FROZEN, Grid, load_env_map, run_algo
+
+def measure(fn, repeats=20, warmup=3):
+    for _ in range(warmup):
+        fn()
+    times = []
+    enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            gc.collect()
+            gc.disable()
+            t0 = time.perf_counter_ns()
+            fn()
+            times.append((time.perf_counter_ns() - t0) / 1e9)
+            gc.enable()
+    finally:
+        if enabled:
+            gc.enable()
+        else:
+            gc.disable()
+    return times
+
+def summarize(times):
+    times = sorted(times)
+    if len(times) > 1:
+        q = statistics.quantiles(times, n=100, method="inclusive")
+        p25, p75, p95 = q[24], q[74], q[94]
+    else:
+        p25 = p75 = p95 = times[0]
+    med = statistics.median(times)
+    return {
+        "n": len(times),
+        "median": med,
+        "p25": p25,
+        "p75": p75,
+        "p95": p95,
+        "iqr": p75 - p25,
+        "min": times[0],
+        "ops_per_s": 1 / med if med > 0 else float("inf"),
+    }
+
+def bench_key(algo, env_seed, cost_mode):
+    return f"{algo}|{env_seed}|{cost_mode}"
+
+def run_bench(algos, seeds, cost_modes=(1, 2), repeats=20, warmup=3, maps="random"):
+    results = {}
+    for env_seed in seeds:
+        desc, S, G = load_env_map(env_seed, maps)
+        grid = Grid(desc)
+        grid.components()   # la precomputación no entra en las mediciones
+        for algo in algos:
+            for cm in cost_modes:
+                times = measure(lambda: run_algo(grid, S, G, algo, cm), repeats, warmup)
+                results[bench_key(algo, env_seed, cm)] = summarize(times)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "map_size": MAP_SIZE,
+            "p_frozen": P_FROZEN,
+            "maps": maps,
+            "repeats": repeats,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+def compare(base, new, threshold=0.10):
+    # [(key, ratio, regresión?)] para las claves presentes en ambos
+    rows = []
+    for key, b in base["results"].items():
+        n = new["results"].get(key)
+        if n is None:
+            continue
+        ratio = n["median"] / b["median"] if b["median"] > 0 else float("inf")
+        rows.append((key, ratio, ratio > 1 + threshold and n["p25"] > b["p75"]))
+    return rows
+
+def print_table(res):
+    print(f"{'key':<22}{'median ms':>11}{'p95 ms':>10}{'IQR ms':>10}{'ops/s':>10}")
+    for key, s in res["results"].items():
+        print(f"{key:<22}{s['median']*1e3:>11.3f}{s['p95']*1e3:>10.3f}{s['iqr']*1e3:>10.3f}{s['ops_per_s']:>10.1f}")
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--algos", default=",".join(ALGORITHMS))
+    p.add_argument("--n_envs", type=int, default=5)
+    p.add_argument("--start_seed", type=int, default=0)
+    p.add_argument("--cost_modes", default="1,2")
+    p.add_argument("--maps", choices=MAP_KINDS, default="random")
+    p.add_argument("--repeats", type=int, default=20)
+    p.add_argument("--warmup", type=int, default=3)
+    p.add_argument("--save", help="guarda los resultados como baseline JSON")
+    p.add_argument("--compare", help="baseline JSON contra la que comparar")
+    p.add_argument("--threshold", type=float, default=0.10, help="empeoramiento tolerado de la mediana")
+    args = p.parse_args()
+
+    seeds = range(args.start_seed, args.start_seed + args.n_envs)
+    cost_modes = [int(x) for x in args.cost_modes.split(",")]
+    res = run_bench(args.algos.split(","), seeds, cost_modes, args.repeats, args.warmup, args.maps)
+    print_table(res)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(res, f, indent=2)
+        print(f"Baseline gespeichert in {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+        rows = compare(base, res, args.threshold)
+        regressions = [r for r in rows if r[2]]
+        for key, ratio, bad in rows:
+            print(f"{key:<22}{ratio:>8.2f}x{'  REGRESSION' if bad else ''}")
+        print(f"{len(regressions)} Regressionen in {len(rows)} Vergleichen")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# D* Lite (Koenig & Likhachev) para replanificar cuando cambian agujeros
+#
+# Busca hacia atrás desde G con g/rhs por celda. Cuando algunas celdas pasan
+# de 'F' a 'H' (o al revés) solo se actualizan los vértices afectados y se
+# repara la solución anterior, en vez de correr astar() de nuevo.
+#
+#   planner = DStarLite(desc, S, G, cost_mode=2)
+#   path, actions, explored, g = planner.plan()
+#   planner.update_cells([(r, c, 'H'), ...])      # o diff_cells(desc, nuevo_desc)
+#   path, actions, explored, g = planner.plan()   # explored = solo la reparación
+#
+# Mismo modelo de grilla/costos que main.py: MOVES y step_cost.
+
+import heapq
+from array import array
+
+from main import MOVES, step_cost
+
+INF = float("inf")
+
+def diff_cells(old_desc, new_desc):
+    # celdas que cambiaron de transitable a agujero o viceversa
+    changes = []
+    for r, (a, b) in enumerate(zip(old_desc, new_desc)):
+        if a != b:
+            for c, (x, y) in enumerate(zip(a, b)):
+                if (x == 'H') != (y == 'H'):
+                    changes.append((r, c, 'H' if y == 'H' else 'F'))
+    return changes
+
+class DStarLite:
+    def __init__(self, desc, start, goal, cost_mode=1):
+        self.h, self.w = len(desc), len(desc[0])
+        n = self.h * self.w
+        self.free = bytearray(ch != 'H' for row in desc for ch in row)
+        self.costs = tuple(step_cost(a, cost_mode) for a in range(4))
+        self.wx, self.wy = self.costs[0], self.costs[1]
+        self.start = start[0] * self.w + start[1]
+        self.goal = goal[0] * self.w + goal[1]
+        self.g = array("d", [INF]) * n
+        self.rhs = array("d", [INF]) * n
+        self.km = 0
+        self.queue = []      # heap de (k1, k2, celda), con entradas obsoletas
+        self.qkey = {}       # celda -> clave vigente en la cola
+        self.rhs[self.goal] = 0
+        self._push(self.goal)
+
+    # --- grilla ---
+    def _neighbors(self, i):
+        # (vecino, acción de i al vecino); costo simétrico: vale para pred y succ
+        r, c = divmod(i, self.w)
+        for a in range(4):
+            dr, dc = MOVES[a]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.h and 0 <= nc < self.w:
+                yield nr * self.w + nc, a
+
+    def _cost(self, i, j, a):
+        return self.costs[a] if self.free[i] and self.free[j] else INF
+
+    def _hdist(self, i, j):
+        (r1, c1), (r2, c2) = divmod(i, self.w), divmod(j, self.w)
+        return self.wx * abs(c1 - c2) + self.wy * abs(r1 - r2)
+
+    # --- cola de prioridad ---
+    def _key(self, i):
+        m = min(self.g[i], self.rhs[i])
+        return (m + self._hdist(self.start, i) + self.km, m)
+
+    def _push(self, i):
+        k = self._key(i)
+        self.qkey[i] = k
+        heapq.heappush(self.queue, (k[0], k[1], i))
+
+    def _top(self):
+        q = self.queue
+        while q and self.qkey.get(q[0][2]) != (q[0][0], q[0][1]):
+            heapq.heappop(q)
+        return q[0] if q else None
+
+    def _update_vertex(self, i):
+        if i != self.goal:
+            best = INF
+            if self.free[i]:
+                for j, a in self._neighbors(i):
+                    v = self._cost(i, j, a) + self.g[j]
+                    if v < best:
+                        best = v
+            self.rhs[i] = best
+        self.qkey.pop(i, None)
+        if self.g[i] != self.rhs[i]:
+            self._push(i)
+
+    def _compute(self):
+        explored = 0
+        s = self.start
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_start = self._key(s)
+            if (top[0], top[1]) >= k_start and self.rhs[s] == self.g[s]:
+                break
+            k_old, u = (top[0], top[1]), top[2]
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u)
+                continue
+            heapq.heappop(self.queue)
+            del self.qkey[u]
+            explored += 1
+            if self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                for p, _ in self._neighbors(u):
+                    self._update_vertex(p)
+            else:
+                self.g[u] = INF
+                self._update_vertex(u)
+                for p, _ in self._neighbors(u):
+                    self._update_vertex(p)
+        return explored
+
+    # --- API ---
+    def plan(self):
+        # devuelve (path, actions, explored, g) como run_algo
+        explored = self._compute()
+        s, t = self.start, self.goal
+        if self.g[s] == INF:
+            return None, None, explored, None
+        path, actions = [divmod(s, self.w)], []
+        i = s
+        while i != t:
+            best, nxt, act = INF, -1, -1
+            for j, a in self._neighbors(i):
+                v = self._cost(i, j, a) + self.g[j]
+                if v < best:
+                    best, nxt, act = v, j, a
+            i = nxt
+            path.append(divmod(i, self.w))
+            actions.append(act)
+        return path, actions, explored, int(self.g[s])
+
+    def update_cells(self, changes):
+        # changes: [(r, c, 'H' | 'F'), ...]
+        touched = set()
+        for r, c, ch in changes:
+            i = r * self.w + c
+            if i in (self.start, self.goal) and ch == 'H':
+                raise ValueError("S y G no pueden convertirse en agujero")
+            free = ch != 'H'
+            if self.free[i] != free:
+                self.free[i] = free
+                touched.add(i)
+                touched.update(j for j, _ in self._neighbors(i))
+        for i in touched:
+            self._update_vertex(i)
+
+    def move_start(self, new_start):
+        # el agente avanzó: se corrige km para no reordenar la cola
+        i = new_start[0] * self.w + new_start[1]
+        self.km += self._hdist(self.start, i)
+        self.start = i
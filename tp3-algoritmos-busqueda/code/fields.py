@@ -0,0 +1,153 @@
+# Campos de distancia reutilizables para muchas consultas sobre un mismo mapa
+#
+# Como los movimientos son reversibles con el mismo costo, el campo desde una
+# celda sirve tanto de "single-source" como de "single-target". Una consulta
+# (start, goal) se responde bajando por el gradiente del campo de goal (o
+# subiendo desde goal por el campo de start), sin volver a buscar.
+#
+#   df = DistanceFields(desc)
+#   path, actions, explored, g = df.query(S, G, cost_mode=2)
+#   path, actions, explored, g = df.astar_alt(S, G, cost_mode=2)   # A* + ALT
+
+from array import array
+from collections import OrderedDict, Counter, deque
+
+from main import as_grid, astar, BucketQueue, ACTION_COSTS, INF, OPP
+
+def distance_field(grid, src, cost_mode):
+    # distancias exactas desde la celda src (índice plano); INF = inalcanzable
+    nbr = grid.nbr
+    dist = array("i", [INF]) * grid.n
+    dist[src] = 0
+    if cost_mode == 1:
+        q = deque([src])
+        while q:
+            i = q.popleft()
+            nd = dist[i] + 1
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j >= 0 and dist[j] == INF:
+                    dist[j] = nd
+                    q.append(j)
+        return dist
+    costs = ACTION_COSTS[cost_mode]
+    pq = BucketQueue(max(costs))
+    pq.push(0, src)
+    while pq.size:
+        d, i = pq.pop()
+        if d > dist[i]:
+            continue
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j >= 0 and d + costs[a] < dist[j]:
+                dist[j] = d + costs[a]
+                pq.push(dist[j], j)
+    return dist
+
+def descend(grid, dist, i, cost_mode):
+    # sigue el gradiente de dist desde i hasta la fuente del campo
+    nbr, costs = grid.nbr, ACTION_COSTS[cost_mode]
+    cells, acts = [i], []
+    while dist[i]:
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j >= 0 and dist[j] + costs[a] == dist[i]:
+                break
+        acts.append(a)
+        cells.append(j)
+        i = j
+    return cells, acts
+
+class DistanceFields:
+    def __init__(self, desc, max_fields=64):
+        self.grid = as_grid(desc)
+        self.max_fields = max_fields
+        self.fields = OrderedDict()   # (celda, cost_mode) -> dist, orden LRU
+        self.landmarks = {}           # cost_mode -> [(celda, dist), ...]
+
+    def field(self, pos, cost_mode):
+        key = (self.grid.index(pos), cost_mode)
+        dist = self.fields.get(key)
+        if dist is None:
+            dist = distance_field(self.grid, key[0], cost_mode)
+            self.fields[key] = dist
+            if len(self.fields) > self.max_fields:
+                self.fields.popitem(last=False)
+        else:
+            self.fields.move_to_end(key)
+        return dist
+
+    def query(self, start, goal, cost_mode):
+        # explored = celdas recorridas en el descenso (el campo puede venir de cache)
+        grid = self.grid
+        s, t = grid.index(start), grid.index(goal)
+        if not grid.connected(start, goal):
+            return None, None, 0, None
+        if (t, cost_mode) not in self.fields and (s, cost_mode) in self.fields:
+            # solo está el campo de start: se baja desde goal y se invierte
+            dist = self.field(start, cost_mode)
+            cells, acts = descend(grid, dist, t, cost_mode)
+            cells.reverse()
+            acts = [OPP[a] for a in reversed(acts)]
+            g = dist[t]
+        else:
+            dist = self.field(goal, cost_mode)
+            cells, acts = descend(grid, dist, s, cost_mode)
+            g = dist[s]
+        return [grid.pos(i) for i in cells], acts, len(cells), g
+
+    # --- ALT: cotas por desigualdad triangular con landmarks ---
+    def build_landmarks(self, k=4, cost_mode=1, around=None):
+        # selección "farthest point" dentro de la región de `around`
+        # (por defecto, la región libre más grande)
+        grid = self.grid
+        if around is None:
+            sizes = Counter(grid.components())
+            sizes.pop(-1, None)
+            label = max(sizes, key=sizes.get)
+            cur = grid.components().index(label)
+        else:
+            cur = grid.index(around)
+        cur = farthest(distance_field(grid, cur, cost_mode))
+        marks, mind = [], None
+        for _ in range(k):
+            dist = distance_field(grid, cur, cost_mode)
+            marks.append((cur, dist))
+            mind = dist if mind is None else array("i", map(min, mind, dist))
+            cur = farthest(mind)
+        self.landmarks[cost_mode] = marks
+        return [grid.pos(i) for i, _ in marks]
+
+    def alt_heuristic(self, goal, cost_mode):
+        # h(i) = max(Manhattan ponderado, max_L |d_L(i) - d_L(goal)|); admisible y consistente
+        if cost_mode not in self.landmarks:
+            self.build_landmarks(cost_mode=cost_mode)
+        w = self.grid.w
+        t = self.grid.index(goal)
+        gr, gc = goal
+        wx, wy = ACTION_COSTS[cost_mode][0], ACTION_COSTS[cost_mode][1]
+        # landmarks de otra región no acotan nada (INF)
+        terms = [(dist, dist[t]) for _, dist in self.landmarks[cost_mode] if dist[t] < INF]
+        def h(i):
+            r, c = divmod(i, w)
+            best = wx*abs(gc - c) + wy*abs(gr - r)
+            for dist, dt in terms:
+                d = abs(dist[i] - dt)
+                if d > best:
+                    best = d
+            return best
+        return h
+
+    def astar_alt(self, start, goal, cost_mode, stats=None):
+        return astar(self.grid, start, goal, cost_mode, stats=stats,
+                     hfun=self.alt_heuristic(goal, cost_mode))
+
+def farthest(dist):
+    best, arg = -1, -1
+    for i, d in enumerate(dist):
+        if best < d < INF:
+            best, arg = d, i
+    return arg
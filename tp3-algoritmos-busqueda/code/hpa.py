@@ -0,0 +1,182 @@
+# HPA*: búsqueda jerárquica sobre el mapa dividido en tiles
+#
+# Preproceso (una vez por mapa y cost_mode):
+#   - el mapa se parte en tiles de cluster x cluster celdas
+#   - en cada borde entre dos tiles, cada tramo de celdas libres a ambos lados
+#     da 1 entrada (tramo corto) o 2 (extremos de un tramo de >= 6 celdas)
+#   - dentro de cada tile se guardan las distancias entre sus entradas
+# Consulta: S y G se conectan a las entradas de su tile, se busca en el
+# grafo abstracto y cada tramo se refina con una UCS restringida al tile.
+#
+#   hpa = HPAStar(desc, cluster=16, cost_mode=2)
+#   path, actions, explored, g = hpa.query(S, G)
+#
+# El camino es válido pero puede ser algo más caro que el óptimo.
+
+import heapq
+from array import array
+from collections import defaultdict
+
+from main import as_grid, ACTION_COSTS
+
+LONG_ENTRANCE = 6
+
+class HPAStar:
+    def __init__(self, desc, cluster=16, cost_mode=1):
+        self.grid = as_grid(desc)
+        self.k = cluster
+        self.cost_mode = cost_mode
+        self.costs = ACTION_COSTS[cost_mode]
+        self.edges = defaultdict(dict)        # nodo -> {vecino: costo}
+        self.tile_nodes = defaultdict(set)    # tile -> entradas del tile
+        self._build_tiles()
+        self._build_entrances()
+        self._build_intra()
+        self.grid.components()   # etiquetas de regiones: query() descarta S/G desconectados en O(1)
+
+    # --- tiles ---
+    def _build_tiles(self):
+        h, w, k = self.grid.h, self.grid.w, self.k
+        tw = (w + k - 1) // k
+        row_ids = [c // k for c in range(w)]
+        self.tile_id = array("i")
+        for r in range(h):
+            base = (r // k) * tw
+            self.tile_id.extend([base + t for t in row_ids])
+
+    def tile_of(self, i):
+        return self.tile_id[i]
+
+    def _local_search(self, src, dst=None):
+        # UCS desde src sin salir de su tile (se corta al llegar a dst, si se da)
+        tid = self.tile_id
+        tile = tid[src]
+        nbr, costs = self.grid.nbr, self.costs
+        dist = {src: 0}
+        parent = {src: (None, None)}
+        pq = [(0, src)]
+        explored = 0
+        while pq:
+            d, i = heapq.heappop(pq)
+            if d > dist[i]:
+                continue
+            explored += 1
+            if i == dst:
+                break
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j < 0 or tid[j] != tile:
+                    continue
+                nd = d + costs[a]
+                if nd < dist.get(j, nd + 1):
+                    dist[j] = nd
+                    parent[j] = (i, a)
+                    heapq.heappush(pq, (nd, j))
+        return dist, parent, explored
+
+    # --- preproceso ---
+    def _add_entrance(self, i, j, cost):
+        self.edges[i][j] = cost
+        self.edges[j][i] = cost
+        self.tile_nodes[self.tile_of(i)].add(i)
+        self.tile_nodes[self.tile_of(j)].add(j)
+
+    def _scan_border(self, pairs, cost):
+        # pairs: celdas enfrentadas (i, j) a lo largo de un borde, en orden
+        free = self.grid.free
+        run = []
+        for i, j in pairs + [(None, None)]:
+            if i is not None and free[i] and free[j]:
+                run.append((i, j))
+                continue
+            if run:
+                if len(run) >= LONG_ENTRANCE:
+                    self._add_entrance(*run[0], cost)
+                    self._add_entrance(*run[-1], cost)
+                else:
+                    self._add_entrance(*run[len(run) // 2], cost)
+                run = []
+
+    def _build_entrances(self):
+        h, w, k = self.grid.h, self.grid.w, self.k
+        for c in range(k - 1, w - 1, k):        # bordes verticales entre tiles
+            for r0 in range(0, h, k):
+                rows = range(r0, min(r0 + k, h))
+                self._scan_border([(r*w + c, r*w + c + 1) for r in rows], self.costs[2])
+        for r in range(k - 1, h - 1, k):        # bordes horizontales entre tiles
+            for c0 in range(0, w, k):
+                cols = range(c0, min(c0 + k, w))
+                self._scan_border([(r*w + c, (r+1)*w + c) for c in cols], self.costs[1])
+
+    def _build_intra(self):
+        for nodes in self.tile_nodes.values():
+            for u in nodes:
+                dist = self._local_search(u)[0]
+                for v in nodes:
+                    if v != u and v in dist:
+                        self.edges[u][v] = min(dist[v], self.edges[u].get(v, dist[v]))
+
+    # --- consulta ---
+    def _h(self, i, t):
+        w = self.grid.w
+        (r1, c1), (r2, c2) = divmod(i, w), divmod(t, w)
+        return self.costs[0] * abs(c1 - c2) + self.costs[1] * abs(r1 - r2)
+
+    def query(self, start, goal):
+        grid = self.grid
+        s, t = grid.index(start), grid.index(goal)
+        if not grid.connected(start, goal):
+            return None, None, 0, None
+        # S y G se enganchan al grafo abstracto solo para esta consulta
+        extra = defaultdict(dict)
+        for x in (s, t):
+            tile = self.tile_of(x)
+            dist = self._local_search(x)[0]
+            for v in self.tile_nodes[tile] | {s, t}:
+                if v != x and v in dist:
+                    extra[x][v] = dist[v]
+                    extra[v][x] = dist[v]
+        explored = 0
+        g = {s: 0}
+        parent = {s: None}
+        pq = [(self._h(s, t), 0, s)]
+        while pq:
+            f, d, u = heapq.heappop(pq)
+            if d > g[u]:
+                continue
+            explored += 1
+            if u == t:
+                break
+            for nbrs in (self.edges.get(u, {}), extra.get(u, {})):
+                for v, c in nbrs.items():
+                    nd = d + c
+                    if nd < g.get(v, nd + 1):
+                        g[v] = nd
+                        parent[v] = u
+                        heapq.heappush(pq, (nd + self._h(v, t), nd, v))
+        if t not in parent:
+            return None, None, explored, None
+        nodes = [t]
+        while parent[nodes[-1]] is not None:
+            nodes.append(parent[nodes[-1]])
+        nodes.reverse()
+        # refinamiento: los tramos entre tiles son un solo paso; los internos
+        # se resuelven con UCS restringida al tile (no recorre el mapa entero)
+        path, actions = [start], []
+        for u, v in zip(nodes, nodes[1:]):
+            if self.tile_of(u) != self.tile_of(v):
+                seg = [v]
+                acts = [next(a for a in range(4) if grid.nbr[4*u + a] == v)]
+            else:
+                _, par, e = self._local_search(u, v)
+                explored += e
+                seg, acts, i = [], [], v
+                while i != u:
+                    seg.append(i)
+                    i, a = par[i]
+                    acts.append(a)
+                seg.reverse(); acts.reverse()
+            path.extend(grid.pos(i) for i in seg)
+            actions.extend(acts)
+        return path, actions, explored, sum(self.costs[a] for a in actions)
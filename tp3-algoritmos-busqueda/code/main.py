@@ -6,10 +6,10 @@
 # vi)  A*
 
 import time, random, heapq
-from collections import deque
-import gymnasium as gym
-from gymnasium import wrappers
-import csv, os
+from array import array
+from collections import deque, Counter, OrderedDict
+import csv, os, argparse, functools, tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))          # …/tp3-algoritmos-busqueda/code
 OUT_CSV  = os.path.abspath(os.path.join(BASE_DIR, "..", "results.csv"))
@@ -17,7 +17,27 @@ OUT_CSV  = os.path.abspath(os.path.join(BASE_DIR, "..", "results.csv"))
 #0=izquierda, 1=abajo, 2=derecha, 3=arriba
 MOVES = {0:(0,-1), 1:(1,0), 2:(0,1), 3:(-1,0)}
 
-def generate_random_map_custom(size=100, p_frozen=0.92, seed=42):
+def label_components(free, w):
+    # etiqueta las regiones 4-conexas de celdas libres (-1 = agujero)
+    n = len(free)
+    comp = array("i", [-1]) * n
+    label = 0
+    for s in range(n):
+        if not free[s] or comp[s] >= 0:
+            continue
+        comp[s] = label
+        stack = [s]
+        while stack:
+            i = stack.pop()
+            c = i % w
+            for j in (i-1 if c else -1, i+w, i+1 if c+1 < w else -1, i-w):
+                if 0 <= j < n and free[j] and comp[j] < 0:
+                    comp[j] = label
+                    stack.append(j)
+        label += 1
+    return comp
+
+def generate_random_map_custom(size=100, p_frozen=0.92, seed=42, solvable=False):
     rng = random.Random(seed)
     grid = []
     for _ in range(size):
@@ -28,16 +48,32 @@ def generate_random_map_custom(size=100, p_frozen=0.92, seed=42):
             r, c = rng.randrange(size), rng.randrange(size)
             if grid[r][c] == 'F':
                 return r, c
-    sr, sc = rand_free()
-    gr, gc = rand_free()
-    while (gr, gc) == (sr, sc):
+    def rand_pair():
+        sr, sc = rand_free()
         gr, gc = rand_free()
+        while (gr, gc) == (sr, sc):
+            gr, gc = rand_free()
+        return (sr, sc), (gr, gc)
+    (sr, sc), (gr, gc) = rand_pair()
+    if solvable:
+        # se sortean S y G de nuevo (mismos agujeros) hasta que queden conectados
+        comp = label_components(bytearray(ch == 'F' for row in grid for ch in row), size)
+        sizes = Counter(comp)
+        sizes.pop(-1, None)
+        if max(sizes.values(), default=0) < 2:
+            raise ValueError("el mapa no tiene ninguna región con 2 celdas libres")
+        while comp[sr*size + sc] != comp[gr*size + gc]:
+            (sr, sc), (gr, gc) = rand_pair()
     grid[sr][sc] = 'S'
     grid[gr][gc] = 'G'
     desc = [''.join(row) for row in grid]
     return desc, (sr, sc), (gr, gc)
 
 def make_env(desc, max_steps=1000, is_slippery=False, render_mode=None):
+    # gymnasium se importa recién acá: la búsqueda no necesita el env
+    # (solo rollouts.py y render), y el import pesa en cada worker
+    import gymnasium as gym
+    from gymnasium import wrappers
     env = gym.make("FrozenLake-v1", desc=desc, is_slippery=is_slippery, render_mode=render_mode).env
     env = wrappers.TimeLimit(env, max_episode_steps=max_steps)
     return env
@@ -52,28 +88,74 @@ def neighbors(desc, r, c):
         if in_bounds(nr, nc, h, w) and passable(desc, nr, nc):
             yield nr, nc, a
 
-def reconstruct(parent, start, goal):
-    r, c = goal
-    path = [(r, c)]
-    while (r, c) != start:
-        r, c = parent[(r, c)][0]
-        path.append((r, c))
-    path.reverse()
-    actions = []
-    for i in range(len(path)-1):
-        r1, c1 = path[i]
-        r2, c2 = path[i+1]
-        dr, dc = r2-r1, c2-c1
-        for a, (mdr, mdc) in MOVES.items():
-            if (dr, dc) == (mdr, mdc):
-                actions.append(a); break
-    return path, actions
+# Mapa "compilado": celdas como índices planos i = r*w + c, bitmap de celdas
+# transitables y tabla de vecinos nbr[4*i + a] (-1 = borde o agujero).
+# parent/g_cost viven en arrays int32 en vez de dicts con tuplas (r, c).
+_FREE_TABLE = bytes(0 if b == ord('H') else 1 for b in range(256))
+INF = 2**31 - 1
+
+class Grid:
+    __slots__ = ("desc", "h", "w", "n", "free", "nbr", "_comp")
+
+    def __init__(self, desc):
+        h, w = len(desc), len(desc[0])
+        n = h * w
+        free = bytearray(n)
+        for r, row in enumerate(desc):
+            free[r*w:(r+1)*w] = row.encode("ascii").translate(_FREE_TABLE)
+        nbr = array("i", [-1]) * (4 * n)
+        cells = range(n)
+        nbr[0::4] = array("i", [i-1 if i % w and free[i-1] else -1 for i in cells])
+        nbr[1::4] = array("i", [i+w if i+w < n and free[i+w] else -1 for i in cells])
+        nbr[2::4] = array("i", [i+1 if (i+1) % w and free[i+1] else -1 for i in cells])
+        nbr[3::4] = array("i", [i-w if i >= w and free[i-w] else -1 for i in cells])
+        self.desc, self.h, self.w, self.n = desc, h, w, n
+        self.free, self.nbr = free, nbr
+        self._comp = None
+
+    def components(self):
+        # se calcula una sola vez por mapa y queda guardado en el Grid
+        if self._comp is None:
+            self._comp = label_components(self.free, self.w)
+        return self._comp
+
+    def connected(self, start, goal):
+        comp = self.components()
+        ca = comp[self.index(start)]
+        return ca >= 0 and ca == comp[self.index(goal)]
+
+    def index(self, pos):
+        return pos[0] * self.w + pos[1]
+
+    def pos(self, i):
+        return divmod(i, self.w)
+
+def as_grid(desc):
+    return desc if isinstance(desc, Grid) else Grid(desc)
+
+def new_parents(n):
+    # parent[i] = -1 -> no visitado; pact[i] = acción con la que se llegó a i
+    return array("i", [-1]) * n, bytearray(n)
+
+def reconstruct(grid, parent, pact, s, t):
+    cells, acts = [t], []
+    i = t
+    while i != s:
+        acts.append(pact[i])
+        i = parent[i]
+        cells.append(i)
+    cells.reverse(); acts.reverse()
+    w = grid.w
+    return [divmod(i, w) for i in cells], acts
 
 def step_cost(action, cost_mode):
     if cost_mode == 1:
         return 1
     return 1 if action in (0,2) else 10
 
+# costo por acción (0..3) según cost_mode, para no llamar step_cost en los bucles
+ACTION_COSTS = {1: (1, 1, 1, 1), 2: (1, 10, 1, 10)}
+
 # A* heuristica
 def heuristic(pos, goal, cost_mode):
     (r, c), (gr, gc) = pos, goal
@@ -82,125 +164,702 @@ def heuristic(pos, goal, cost_mode):
         return dx + dy
     return dx*1 + dy*10
 
-def random_search(desc, start, goal, max_expansions=200000):
-    frontier = [start]
-    parent = {start: (None, None)}  # (prev, action)
-    explored = 0
+# contadores opcionales: si se pasa un dict stats, cada algoritmo lo completa
+# con pushes/pops/peak_frontier (y stale_pops, reexpansions donde aplica)
+def put_stats(stats, **counters):
+    if stats is not None:
+        stats.update(counters)
+
+def random_search(desc, start, goal, max_expansions=200000, stats=None):
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    frontier = [s]
+    explored = pushes = 0
+    peak = 1
     rng = random.Random(0)
     while frontier and explored < max_expansions:
-        i = rng.randrange(len(frontier))
-        r, c = frontier.pop(i)
+        i = frontier.pop(rng.randrange(len(frontier)))
         explored += 1
-        if (r, c) == goal:
-            p = []
-            cur = (r, c)
-            while parent[cur][0] is not None:
-                p.append(cur)
-                cur = parent[cur][0]
-            p.append(start); p.reverse()
-            actions = []
-            for j in range(len(p)-1):
-                r1,c1 = p[j]; r2,c2 = p[j+1]
-                dr,dc = r2-r1, c2-c1
-                for a,(mdr,mdc) in MOVES.items():
-                    if (dr,dc)==(mdr,mdc): actions.append(a); break
-            return p, actions, explored
-        for nr, nc, a in neighbors(desc, r, c):
-            if (nr, nc) not in parent:
-                parent[(nr, nc)] = ((r, c), a)
-                frontier.append((nr, nc))
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
+            return path, actions, explored
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j >= 0 and parent[j] < 0:
+                parent[j] = i; pact[j] = a
+                frontier.append(j)
+                pushes += 1
+        if len(frontier) > peak:
+            peak = len(frontier)
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
     return None, None, explored
 
-def bfs(desc, start, goal):
-    q = deque([start])
-    parent = {start:(None, None)}
-    explored = 0
+def bfs(desc, start, goal, stats=None):
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    q = deque([s])
+    explored = pushes = 0
+    peak = 1
     while q:
-        r, c = q.popleft()
+        i = q.popleft()
         explored += 1
-        if (r, c) == goal:
-            path, actions = reconstruct(parent, start, goal)
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
             return path, actions, explored
-        for nr, nc, a in neighbors(desc, r, c):
-            if (nr, nc) not in parent:
-                parent[(nr, nc)] = ((r, c), a)
-                q.append((nr, nc))
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j >= 0 and parent[j] < 0:
+                parent[j] = i; pact[j] = a
+                q.append(j)
+                pushes += 1
+        if len(q) > peak:
+            peak = len(q)
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
     return None, None, explored
 
-def dfs(desc, start, goal, max_expansions=200000):
-    stack = [start]
-    parent = {start:(None, None)}
-    explored = 0
+def dfs(desc, start, goal, max_expansions=200000, stats=None):
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    stack = [s]
+    explored = pushes = 0
+    peak = 1
     while stack and explored < max_expansions:
-        r, c = stack.pop()
+        i = stack.pop()
         explored += 1
-        if (r, c) == goal:
-            path, actions = reconstruct(parent, start, goal)
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
             return path, actions, explored
-        for nr, nc, a in reversed(list(neighbors(desc, r, c))):
-            if (nr, nc) not in parent:
-                parent[(nr, nc)] = ((r, c), a)
-                stack.append((nr, nc))
+        b = 4 * i
+        for a in (3, 2, 1, 0):
+            j = nbr[b+a]
+            if j >= 0 and parent[j] < 0:
+                parent[j] = i; pact[j] = a
+                stack.append(j)
+                pushes += 1
+        if len(stack) > peak:
+            peak = len(stack)
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
     return None, None, explored
 
-def dls(desc, start, goal, limit):
-    stack = [(start, 0)]
-    parent = {start:(None, None)}
-    best_depth = {start:0}
-    explored = 0
+def dls(desc, start, goal, limit, stats=None):
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    best_depth = array("i", [INF]) * grid.n
+    best_depth[s] = 0
+    expanded = bytearray(grid.n)  # para contar re-expansiones (misma celda, menor profundidad)
+    stack = [(s, 0)]
+    explored = pushes = reexp = 0
+    peak = 1
     while stack:
-        (r, c), d = stack.pop()
+        i, d = stack.pop()
         explored += 1
-        if (r, c) == goal:
-            path, actions = reconstruct(parent, start, goal)
+        if expanded[i]:
+            reexp += 1
+        expanded[i] = 1
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak, reexpansions=reexp)
+            path, actions = reconstruct(grid, parent, pact, s, t)
             return path, actions, explored
         if d < limit:
-            for nr, nc, a in neighbors(desc, r, c):
-                nd = d+1
-                if (nr, nc) not in best_depth or nd < best_depth[(nr, nc)]:
-                    best_depth[(nr, nc)] = nd
-                    parent[(nr, nc)] = ((r, c), a)
-                    stack.append(((nr, nc), nd))
+            nd = d + 1
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j >= 0 and nd < best_depth[j]:
+                    best_depth[j] = nd
+                    parent[j] = i; pact[j] = a
+                    stack.append((j, nd))
+                    pushes += 1
+            if len(stack) > peak:
+                peak = len(stack)
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak, reexpansions=reexp)
+    return None, None, explored
+
+def dls_incremental(desc, start, goal, limits=(50, 75, 100), stats=None):
+    # Profundización incremental: los nodos cortados por el límite L (la
+    # "frontera") se guardan y se usan como pila inicial del límite siguiente,
+    # así no se repite el trabajo de L. best_depth/parent se conservan.
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    best_depth = array("i", [INF]) * grid.n
+    best_depth[s] = 0
+    expanded = bytearray(grid.n)
+    stack = [(s, 0)]
+    explored = pushes = reexp = 0
+    peak = 1
+    per_limit = []
+    for limit in limits:
+        boundary = []
+        phase = 0
+        while stack:
+            i, d = stack.pop()
+            if d > best_depth[i]:
+                continue  # ya se llegó más arriba
+            phase += 1
+            if i == t:
+                per_limit.append(f"{limit}:{phase}")
+                put_stats(stats, pushes=pushes, pops=explored + phase, peak_frontier=peak, reexpansions=reexp,
+                          dls_limit=limit, explored_per_limit=";".join(per_limit))
+                path, actions = reconstruct(grid, parent, pact, s, t)
+                return path, actions, explored + phase
+            if d == limit:
+                boundary.append(i)
+                continue
+            if expanded[i]:
+                reexp += 1
+            expanded[i] = 1
+            nd = d + 1
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j >= 0 and nd < best_depth[j]:
+                    best_depth[j] = nd
+                    parent[j] = i; pact[j] = a
+                    stack.append((j, nd))
+                    pushes += 1
+            if len(stack) + len(boundary) > peak:
+                peak = len(stack) + len(boundary)
+        explored += phase
+        per_limit.append(f"{limit}:{phase}")
+        # frontera que sigue vigente (no mejorada después de cortarla)
+        stack = [(i, limit) for i in reversed(boundary) if best_depth[i] == limit]
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak, reexpansions=reexp,
+              dls_limit=None, explored_per_limit=";".join(per_limit))
     return None, None, explored
 
-def ucs(desc, start, goal, cost_mode):
-    pq = [(0, start)]
-    parent = {start:(None, None)}
-    g_cost = {start:0}
-    explored = 0
+def ucs(desc, start, goal, cost_mode, queue="heap", stats=None):
+    if queue == "bucket":
+        return dial_search(desc, start, goal, cost_mode, False, stats)
+    grid = as_grid(desc)
+    nbr = grid.nbr
+    costs = ACTION_COSTS[cost_mode]
+    s, t = grid.index(start), grid.index(goal)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    g_cost = array("i", [INF]) * grid.n
+    g_cost[s] = 0
+    pq = [(0, s)]
+    explored = pushes = stale = 0
+    peak = 1
     while pq:
-        g, (r, c) = heapq.heappop(pq)
+        g, i = heapq.heappop(pq)
         explored += 1
-        if (r, c) == goal:
-            path, actions = reconstruct(parent, start, goal)
+        if g > g_cost[i]:
+            stale += 1  # se sigue contando en explored (comportamiento original)
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, stale_pops=stale, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
             return path, actions, explored, g
-        for nr, nc, a in neighbors(desc, r, c):
-            ng = g + step_cost(a, cost_mode)
-            if (nr, nc) not in g_cost or ng < g_cost[(nr, nc)]:
-                g_cost[(nr, nc)] = ng
-                parent[(nr, nc)] = ((r, c), a)
-                heapq.heappush(pq, (ng, (nr, nc)))
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j < 0:
+                continue
+            ng = g + costs[a]
+            if ng < g_cost[j]:
+                g_cost[j] = ng
+                parent[j] = i; pact[j] = a
+                heapq.heappush(pq, (ng, j))
+                pushes += 1
+        if len(pq) > peak:
+            peak = len(pq)
+    put_stats(stats, pushes=pushes, pops=explored, stale_pops=stale, peak_frontier=peak)
     return None, None, explored, None
 
-def astar(desc, start, goal, cost_mode):
+def astar(desc, start, goal, cost_mode, queue="heap", stats=None, hfun=None):
+    # hfun(i) -> cota inferior entera para la celda i (p.ej. ALT en fields.py);
+    # por defecto, heuristic() de Manhattan ponderado
+    if queue == "bucket":
+        return dial_search(desc, start, goal, cost_mode, True, stats)
+    grid = as_grid(desc)
+    nbr, w = grid.nbr, grid.w
+    costs = ACTION_COSTS[cost_mode]
+    wx, wy = (1, 1) if cost_mode == 1 else (1, 10)
+    s, t = grid.index(start), grid.index(goal)
+    gr, gc = goal
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    g_cost = array("i", [INF]) * grid.n
+    g_cost[s] = 0
+    h0 = heuristic(start, goal, cost_mode) if hfun is None else hfun(s)
+    pq = [(h0, 0, s)]
+    explored = pushes = stale = 0
+    peak = 1
+    while pq:
+        f, g, i = heapq.heappop(pq)
+        explored += 1
+        if g > g_cost[i]:
+            stale += 1
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored, stale_pops=stale, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
+            return path, actions, explored, g
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j < 0:
+                continue
+            ng = g + costs[a]
+            if ng < g_cost[j]:
+                g_cost[j] = ng
+                parent[j] = i; pact[j] = a
+                if hfun is None:
+                    r, c = divmod(j, w)
+                    nf = ng + wx*abs(gc - c) + wy*abs(gr - r)
+                else:
+                    nf = ng + hfun(j)
+                heapq.heappush(pq, (nf, ng, j))
+                pushes += 1
+        if len(pq) > peak:
+            peak = len(pq)
+    put_stats(stats, pushes=pushes, pops=explored, stale_pops=stale, peak_frontier=peak)
+    return None, None, explored, None
+
+# --- Cola de buckets (algoritmo de Dial) ---
+# step_cost solo devuelve 1 o 10, así que las prioridades son enteras y todo
+# lo que está en la cola cae en la ventana [cur, cur + span]: alcanza con
+# span+1 buckets circulares y push/pop son O(1).
+class BucketQueue:
+    __slots__ = ("buckets", "nb", "cur", "size")
+
+    def __init__(self, span, prio=0):
+        self.buckets = [[] for _ in range(span + 1)]
+        self.nb = span + 1
+        self.cur = prio
+        self.size = 0
+
+    def push(self, prio, item):
+        self.buckets[prio % self.nb].append(item)
+        self.size += 1
+
+    def pop(self):
+        # devuelve (prioridad, item); prioridades nunca menores que cur
+        nb, buckets = self.nb, self.buckets
+        while not buckets[self.cur % nb]:
+            self.cur += 1
+        self.size -= 1
+        return self.cur, buckets[self.cur % nb].pop()
+
+def dial_search(desc, start, goal, cost_mode, use_h, stats=None):
+    # UCS (use_h=False) o A* (use_h=True) sobre BucketQueue. Las entradas
+    # obsoletas se descartan sin contarlas en explored.
+    grid = as_grid(desc)
+    nbr, w = grid.nbr, grid.w
+    costs = ACTION_COSTS[cost_mode]
+    wx, wy = (1, 1) if cost_mode == 1 else (1, 10)
+    if not use_h:
+        wx = wy = 0
+    s, t = grid.index(start), grid.index(goal)
+    gr, gc = goal
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    g_cost = array("i", [INF]) * grid.n
+    g_cost[s] = 0
+    # con h consistente, f crece a lo sumo costo + variación de h por paso
+    span = max(costs) + max(wx, wy)
+    f0 = wx*abs(gc - start[1]) + wy*abs(gr - start[0])
+    pq = BucketQueue(span, f0)
+    pq.push(f0, s)
+    explored = pushes = stale = 0
+    peak = 1
+    while pq.size:
+        f, i = pq.pop()
+        r, c = divmod(i, w)
+        g = f - wx*abs(gc - c) - wy*abs(gr - r)
+        if g > g_cost[i]:
+            stale += 1
+            continue
+        explored += 1
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored + stale, stale_pops=stale, peak_frontier=peak)
+            path, actions = reconstruct(grid, parent, pact, s, t)
+            return path, actions, explored, g
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j < 0:
+                continue
+            ng = g + costs[a]
+            if ng < g_cost[j]:
+                g_cost[j] = ng
+                parent[j] = i; pact[j] = a
+                r, c = divmod(j, w)
+                pq.push(ng + wx*abs(gc - c) + wy*abs(gr - r), j)
+                pushes += 1
+        if pq.size > peak:
+            peak = pq.size
+    put_stats(stats, pushes=pushes, pops=explored + stale, stale_pops=stale, peak_frontier=peak)
+    return None, None, explored, None
+
+# --- Búsquedas bidireccionales: desde S y desde G a la vez ---
+# Las aristas son simétricas (mismo costo ida y vuelta), así que la búsqueda
+# hacia atrás usa la misma tabla de vecinos; OPP da la acción inversa.
+OPP = (2, 3, 0, 1)
+
+def join_at(grid, pf, af, pb, ab, s, t, m):
+    path, actions = reconstruct(grid, pf, af, s, m)
+    w = grid.w
+    i = m
+    while i != t:
+        actions.append(OPP[ab[i]])
+        i = pb[i]
+        path.append(divmod(i, w))
+    return path, actions
+
+def bibfs(desc, start, goal, stats=None):
+    grid = as_grid(desc)
+    nbr, n = grid.nbr, grid.n
+    s, t = grid.index(start), grid.index(goal)
+    pf, af = new_parents(n)
+    pb, ab = new_parents(n)
+    pf[s] = s; pb[t] = t
+    dist_f = array("i", [INF]) * n
+    dist_b = array("i", [INF]) * n
+    dist_f[s] = 0; dist_b[t] = 0
+    front_f, front_b = [s], [t]
+    if s == t:
+        put_stats(stats, pushes=0, pops=1, peak_frontier=1)
+        return [start], [], 1
+    explored = pushes = 0
+    peak = 2
+    while front_f and front_b:
+        # se expande siempre la capa completa del lado con menos nodos
+        forward = len(front_f) <= len(front_b)
+        if forward:
+            frontier, par, pac, dist, other = front_f, pf, af, dist_f, dist_b
+        else:
+            frontier, par, pac, dist, other = front_b, pb, ab, dist_b, dist_f
+        best, meet = INF, -1
+        nxt = []
+        for i in frontier:
+            explored += 1
+            nd = dist[i] + 1
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j >= 0 and dist[j] == INF:
+                    dist[j] = nd
+                    par[j] = i; pac[j] = a
+                    nxt.append(j)
+                    if other[j] < INF and nd + other[j] < best:
+                        best, meet = nd + other[j], j
+        pushes += len(nxt)
+        if len(front_f) + len(front_b) + len(nxt) > peak:
+            peak = len(front_f) + len(front_b) + len(nxt)
+        if meet >= 0:
+            put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
+            path, actions = join_at(grid, pf, af, pb, ab, s, t, meet)
+            return path, actions, explored
+        if forward:
+            front_f = nxt
+        else:
+            front_b = nxt
+    put_stats(stats, pushes=pushes, pops=explored, peak_frontier=peak)
+    return None, None, explored
+
+def biastar(desc, start, goal, cost_mode, stats=None):
+    grid = as_grid(desc)
+    nbr, w, n = grid.nbr, grid.w, grid.n
+    costs = ACTION_COSTS[cost_mode]
+    wx, wy = (1, 1) if cost_mode == 1 else (1, 10)
+    s, t = grid.index(start), grid.index(goal)
+    pf, af = new_parents(n)
+    pb, ab = new_parents(n)
+    pf[s] = s; pb[t] = t
+    g_f = array("i", [INF]) * n
+    g_b = array("i", [INF]) * n
+    g_f[s] = 0; g_b[t] = 0
     h0 = heuristic(start, goal, cost_mode)
-    pq = [(h0, 0, start)]
-    parent = {start:(None, None)}
-    g_cost = {start:0}
-    explored = 0
+    open_f, open_b = [(h0, 0, s)], [(h0, 0, t)]
+    best, meet = (0, s) if s == t else (INF, -1)
+    explored = pushes = stale = 0
+    peak = 2
+    while open_f and open_b:
+        # ningún camino mejor que best puede tener f < best en ambos lados
+        if max(open_f[0][0], open_b[0][0]) >= best:
+            break
+        if len(open_f) <= len(open_b):
+            pq, g_own, g_oth, par, pac, (tr, tc) = open_f, g_f, g_b, pf, af, goal
+        else:
+            pq, g_own, g_oth, par, pac, (tr, tc) = open_b, g_b, g_f, pb, ab, start
+        f, g, i = heapq.heappop(pq)
+        if g > g_own[i]:
+            stale += 1
+            continue  # entrada obsoleta
+        explored += 1
+        b = 4 * i
+        for a in range(4):
+            j = nbr[b+a]
+            if j < 0:
+                continue
+            ng = g + costs[a]
+            if ng < g_own[j]:
+                g_own[j] = ng
+                par[j] = i; pac[j] = a
+                r, c = divmod(j, w)
+                heapq.heappush(pq, (ng + wx*abs(tc - c) + wy*abs(tr - r), ng, j))
+                pushes += 1
+                if g_oth[j] < INF and ng + g_oth[j] < best:
+                    best, meet = ng + g_oth[j], j
+        if len(open_f) + len(open_b) > peak:
+            peak = len(open_f) + len(open_b)
+    put_stats(stats, pushes=pushes, pops=explored + stale, stale_pops=stale, peak_frontier=peak)
+    if meet < 0:
+        return None, None, explored, None
+    path, actions = join_at(grid, pf, af, pb, ab, s, t, meet)
+    return path, actions, explored, best
+
+# --- Jump Point Search (4-conexo) ---
+# En una grilla 4-conexa con costo por dirección, todos los caminos que usan
+# los mismos movimientos en otro orden cuestan lo mismo. JPS solo inserta en
+# el heap los "jump points": celdas con vecino forzado, el objetivo, o (en
+# saltos verticales) celdas desde las que un salto horizontal encuentra uno.
+HORIZONTAL = (True, False, True, False)
+
+def jps_jump(nbr, i, a, t):
+    # avanza en línea recta desde i en dirección a; devuelve el jump point o -1
+    if HORIZONTAL[a]:
+        sides = (1, 3)
+    else:
+        sides = (0, 2)
+    while True:
+        j = nbr[4*i + a]
+        if j < 0:
+            return -1
+        if j == t:
+            return j
+        bi, bj = 4*i, 4*j
+        for v in sides:
+            if nbr[bj+v] >= 0 and nbr[bi+v] < 0:
+                return j
+        if not HORIZONTAL[a]:
+            for v in sides:
+                if jps_jump(nbr, j, v, t) >= 0:
+                    return j
+        i = j
+
+def jps(desc, start, goal, cost_mode, stats=None):
+    grid = as_grid(desc)
+    nbr, w = grid.nbr, grid.w
+    costs = ACTION_COSTS[cost_mode]
+    s, t = grid.index(start), grid.index(goal)
+    gr, gc = goal
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    g_cost = array("i", [INF]) * grid.n
+    g_cost[s] = 0
+    pq = [(heuristic(start, goal, cost_mode), 0, s)]
+    explored = pushes = stale = 0
+    peak = 1
     while pq:
-        f, g, (r, c) = heapq.heappop(pq)
+        f, g, i = heapq.heappop(pq)
+        if g > g_cost[i]:
+            stale += 1
+            continue  # entrada obsoleta
         explored += 1
-        if (r, c) == goal:
-            path, actions = reconstruct(parent, start, goal)
+        if i == t:
+            put_stats(stats, pushes=pushes, pops=explored + stale, stale_pops=stale, peak_frontier=peak)
+            path, actions = jps_expand(grid, parent, pact, s, t)
             return path, actions, explored, g
-        for nr, nc, a in neighbors(desc, r, c):
-            ng = g + step_cost(a, cost_mode)
-            if (nr, nc) not in g_cost or ng < g_cost[(nr, nc)]:
-                g_cost[(nr, nc)] = ng
-                parent[(nr, nc)] = ((r, c), a)
-                nf = ng + heuristic((nr, nc), goal, cost_mode)
-                heapq.heappush(pq, (nf, ng, (nr, nc)))
+        if i == s:
+            dirs = (0, 1, 2, 3)
+        else:
+            a = pact[i]
+            dirs = (1, 3, a) if HORIZONTAL[a] else (0, 2, a)
+        ri, ci = divmod(i, w)
+        for a in dirs:
+            j = jps_jump(nbr, i, a, t)
+            if j < 0:
+                continue
+            r, c = divmod(j, w)
+            ng = g + costs[a] * (abs(r - ri) + abs(c - ci))
+            if ng < g_cost[j]:
+                g_cost[j] = ng
+                parent[j] = i; pact[j] = a
+                nf = ng + costs[0]*abs(gc - c) + costs[1]*abs(gr - r)
+                heapq.heappush(pq, (nf, ng, j))
+                pushes += 1
+        if len(pq) > peak:
+            peak = len(pq)
+    put_stats(stats, pushes=pushes, pops=explored + stale, stale_pops=stale, peak_frontier=peak)
+    return None, None, explored, None
+
+def jps_expand(grid, parent, pact, s, t):
+    # parent enlaza jump points; se rellenan los tramos rectos entre ellos
+    w = grid.w
+    step = (-1, w, 1, -w)
+    cells, acts = [t], []
+    i = t
+    while i != s:
+        p, a = parent[i], pact[i]
+        while i != p:
+            acts.append(a)
+            i -= step[a]
+            cells.append(i)
+    cells.reverse(); acts.reverse()
+    return [divmod(i, w) for i in cells], acts
+
+# --- ARA*: A* ponderado "anytime" ---
+# Arranca con heuristic() inflada por eps0 (primer camino rápido) y va bajando
+# eps reutilizando OPEN/CLOSED (los nodos mejorados ya cerrados pasan a
+# INCONS) hasta eps = 1 o hasta agotar budget segundos. Tras cada mejora,
+# la cota de subóptimo es min(eps, g(goal) / min_{OPEN ∪ INCONS}(g + h)).
+def arastar(desc, start, goal, cost_mode, budget=0.05, eps0=2.5, eps_step=0.5, stats=None):
+    t0 = time.perf_counter()
+    grid = as_grid(desc)
+    nbr, w = grid.nbr, grid.w
+    costs = ACTION_COSTS[cost_mode]
+    wx, wy = (1, 1) if cost_mode == 1 else (1, 10)
+    s, t = grid.index(start), grid.index(goal)
+    gr, gc = goal
+    def h(i):
+        r, c = divmod(i, w)
+        return wx*abs(gc - c) + wy*abs(gr - r)
+    parent, pact = new_parents(grid.n)
+    parent[s] = s
+    g_cost = array("i", [INF]) * grid.n
+    g_cost[s] = 0
+    closed = array("i", [0]) * grid.n   # número de iteración en que se cerró
+    open_nodes, incons = {s}, set()
+    eps, bound = eps0, INF
+    explored = pushes = iteration = 0
+    best = time_first = None
+    deadline = t0 + budget
+    while True:
+        iteration += 1
+        nodes = open_nodes | incons
+        incons = set()
+        pq = [(g_cost[i] + eps*h(i), i) for i in nodes]
+        heapq.heapify(pq)
+        open_nodes = nodes
+        aborted = False
+        while pq and pq[0][0] < g_cost[t]:
+            key, i = heapq.heappop(pq)
+            if i not in open_nodes or key != g_cost[i] + eps*h(i):
+                continue  # entrada obsoleta
+            open_nodes.discard(i)
+            closed[i] = iteration
+            explored += 1
+            if best is not None and explored % 256 == 0 and time.perf_counter() > deadline:
+                aborted = True
+                break
+            b = 4 * i
+            for a in range(4):
+                j = nbr[b+a]
+                if j < 0:
+                    continue
+                ng = g_cost[i] + costs[a]
+                if ng < g_cost[j]:
+                    g_cost[j] = ng
+                    parent[j] = i; pact[j] = a
+                    if closed[j] == iteration:
+                        incons.add(j)
+                    else:
+                        open_nodes.add(j)
+                        heapq.heappush(pq, (ng + eps*h(j), j))
+                        pushes += 1
+        if aborted or g_cost[t] == INF:
+            break
+        lb = min((g_cost[i] + h(i) for i in open_nodes | incons), default=g_cost[t])
+        bound = min(eps, g_cost[t] / lb) if lb else 1.0
+        best = reconstruct(grid, parent, pact, s, t)
+        if time_first is None:
+            time_first = time.perf_counter() - t0
+        if bound <= 1.0 or time.perf_counter() > deadline:
+            break
+        eps = max(1.0, min(eps - eps_step, bound))
+    put_stats(stats, pushes=pushes, pops=explored, iterations=iteration,
+              time_first=time_first, subopt_bound=(bound if best else None))
+    if best is None:
+        return None, None, explored, None
+    path, actions = best
+    return path, actions, explored, sum(costs[a] for a in actions)
+
+# --- IDA*: memoria proporcional a la profundidad del camino ---
+# DFS acotada por f = g + h con umbral creciente. Solo se guarda el camino
+# actual; opcionalmente una tabla de transposición (celda -> mejor g en la
+# iteración) de a lo sumo tt_size entradas, con desalojo LRU.
+def idastar(desc, start, goal, cost_mode, tt_size=0, max_expansions=200000, stats=None):
+    grid = as_grid(desc)
+    nbr, w = grid.nbr, grid.w
+    costs = ACTION_COSTS[cost_mode]
+    wx, wy = (1, 1) if cost_mode == 1 else (1, 10)
+    s, t = grid.index(start), grid.index(goal)
+    gr, gc = goal
+    def h(i):
+        r, c = divmod(i, w)
+        return wx*abs(gc - c) + wy*abs(gr - r)
+    tt = OrderedDict() if tt_size else None
+    bound = h(s)
+    explored = iterations = peak = tt_peak = 0
+    while explored < max_expansions:
+        iterations += 1
+        next_bound = INF
+        path, acts, gs, nxt = [s], [], [0], [0]
+        on_path = {s}
+        explored += 1
+        while path and explored < max_expansions:
+            i = path[-1]
+            if i == t:
+                put_stats(stats, pushes=explored - iterations, pops=explored, peak_frontier=peak,
+                          iterations=iterations, tt_peak=tt_peak)
+                return [divmod(k, w) for k in path], acts, explored, gs[-1]
+            a = nxt[-1]
+            if a == 4:
+                on_path.discard(path.pop()); gs.pop(); nxt.pop()
+                if acts:
+                    acts.pop()
+                continue
+            nxt[-1] = a + 1
+            j = nbr[4*i + a]
+            if j < 0 or j in on_path:
+                continue
+            ng = gs[-1] + costs[a]
+            f = ng + h(j)
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                continue
+            if tt is not None:
+                seen = tt.get(j)
+                if seen is not None and seen[0] == bound and seen[1] <= ng:
+                    continue  # ya se exploró desde j con g menor en esta iteración
+                tt[j] = (bound, ng)
+                tt.move_to_end(j)
+                if len(tt) > tt_size:
+                    tt.popitem(last=False)
+                if len(tt) > tt_peak:
+                    tt_peak = len(tt)
+            path.append(j); acts.append(a); gs.append(ng); nxt.append(0)
+            on_path.add(j)
+            explored += 1
+            if len(path) > peak:
+                peak = len(path)
+        if next_bound == INF or path:
+            break  # sin solución, o se agotó max_expansions
+        bound = next_bound
+    put_stats(stats, pushes=explored - iterations, pops=explored, peak_frontier=peak,
+              iterations=iterations, tt_peak=tt_peak)
     return None, None, explored, None
 
 def cost_s1(actions):
@@ -217,75 +876,216 @@ def print_env(desc):
     for row in desc:
         print(row)
 
-ALGORITHMS = ["random", "bfs", "dfs", "dls50", "dls75", "dls100", "ucs", "astar"]
+ALGORITHMS = ["random", "bfs", "dfs", "dls50", "dls75", "dls100", "ucs", "astar", "bibfs", "biastar", "jps", "ucs_dial", "astar_dial", "iddls", "idastar", "arastar"]
+# entradas de la tabla de transposición de idastar (presupuesto de memoria)
+IDA_TT_SIZE = 4096
+# presupuesto de tiempo [s] de arastar por consulta
+ARA_BUDGET = 0.05
 
-def run_algo(desc, S, G, name, cost_mode):
+def run_algo(desc, S, G, name, cost_mode, stats=None, check_reachable=True):
+    # conviene pasar una Grid ya armada: las etiquetas de componentes quedan
+    # guardadas en ella y el chequeo S-G es O(1). Con un desc suelto no se
+    # chequea (etiquetar el mapa en cada llamada cuesta más que la búsqueda).
+    prebuilt = isinstance(desc, Grid)
+    desc = as_grid(desc)
+    if check_reachable and prebuilt and not desc.connected(S, G):
+        # S y G en regiones distintas: sin solución, no hace falta buscar
+        return None, None, 0, None
     if name == "random":
-        path, actions, explored = random_search(desc, S, G)
+        path, actions, explored = random_search(desc, S, G, stats=stats)
         g_val = None
     elif name == "bfs":
-        path, actions, explored = bfs(desc, S, G)
+        path, actions, explored = bfs(desc, S, G, stats=stats)
         g_val = None
     elif name == "dfs":
-        path, actions, explored = dfs(desc, S, G)
+        path, actions, explored = dfs(desc, S, G, stats=stats)
         g_val = None
     elif name == "dls50":
-        path, actions, explored = dls(desc, S, G, 50)
+        path, actions, explored = dls(desc, S, G, 50, stats=stats)
         g_val = None
     elif name == "dls75":
-        path, actions, explored = dls(desc, S, G, 75)
+        path, actions, explored = dls(desc, S, G, 75, stats=stats)
         g_val = None
     elif name == "dls100":
-        path, actions, explored = dls(desc, S, G, 100)
+        path, actions, explored = dls(desc, S, G, 100, stats=stats)
+        g_val = None
+    elif name == "iddls":
+        path, actions, explored = dls_incremental(desc, S, G, (50, 75, 100), stats=stats)
         g_val = None
     elif name == "ucs":
-        path, actions, explored, g_val = ucs(desc, S, G, cost_mode)
+        path, actions, explored, g_val = ucs(desc, S, G, cost_mode, stats=stats)
     elif name == "astar":
-        path, actions, explored, g_val = astar(desc, S, G, cost_mode)
+        path, actions, explored, g_val = astar(desc, S, G, cost_mode, stats=stats)
+    elif name == "ucs_dial":
+        path, actions, explored, g_val = ucs(desc, S, G, cost_mode, queue="bucket", stats=stats)
+    elif name == "astar_dial":
+        path, actions, explored, g_val = astar(desc, S, G, cost_mode, queue="bucket", stats=stats)
+    elif name == "bibfs":
+        path, actions, explored = bibfs(desc, S, G, stats=stats)
+        g_val = None
+    elif name == "biastar":
+        path, actions, explored, g_val = biastar(desc, S, G, cost_mode, stats=stats)
+    elif name == "jps":
+        path, actions, explored, g_val = jps(desc, S, G, cost_mode, stats=stats)
+    elif name == "arastar":
+        path, actions, explored, g_val = arastar(desc, S, G, cost_mode, budget=ARA_BUDGET, stats=stats)
+    elif name == "idastar":
+        path, actions, explored, g_val = idastar(desc, S, G, cost_mode, tt_size=IDA_TT_SIZE, stats=stats)
     else:
         raise ValueError(name)
     return path, actions, explored, g_val
 
-def eval_one_environment(env_seed):
-    desc, S, G = generate_random_map_custom(size=100, p_frozen=0.92, seed=env_seed)
-    _ = make_env(desc, max_steps=1000, is_slippery=False, render_mode=None)
+MAP_SIZE, P_FROZEN = 100, 0.92
+# columnas de instrumentación (cost mode 1); peak_mem_kb solo con --instrument
+STAT_FIELDS = ["pushes","pops","stale_pops","peak_frontier","reexpansions","peak_mem_kb",
+               "dls_limit","explored_per_limit","time_first","subopt_bound"]
+CSV_FIELDS = ["algorithm_name","env_n","states_n","actions_count","actions_cost","time","solution_found"] + STAT_FIELDS
+# filas "vi_slippery" (--slippery): states_n = barridos de value iteration
+CSV_FIELDS += ["success_prob"]
 
+def timed_run(grid, S, G, algo, cost_mode, trace_mem=False):
+    stats = {}
+    t0 = time.perf_counter()
+    path, actions, explored, _ = run_algo(grid, S, G, algo, cost_mode, stats=stats)
+    elapsed = time.perf_counter() - t0
+    if trace_mem:
+        # corrida aparte: tracemalloc hace mucho más lenta la búsqueda y no debe entrar en time
+        tracemalloc.start()
+        run_algo(grid, S, G, algo, cost_mode)
+        stats["peak_mem_kb"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return path is not None, actions, explored, elapsed, stats
+
+def make_row(algo, env_seed, r1, r2):
+    found1, actions1, explored1, t1, stats1 = r1
+    found2, actions2, _, _, _ = r2
+    return {
+        "algorithm_name": algo,
+        "env_n": env_seed,
+        "states_n": explored1,
+        "actions_count": len(actions1) if actions1 is not None else None,
+        "actions_cost": cost_s2(actions2) if actions2 is not None else None,
+        "time": t1,
+        "solution_found": (found1 and found2),
+        **{k: stats1.get(k) for k in STAT_FIELDS}
+    }
+
+# random/bfs/dfs/dls*/bibfs/iddls ignoran cost_mode: se corren una vez por mapa y
+# sus acciones se recostean con cost_s2 en make_row.
+COST_INDEPENDENT = {"random", "bfs", "dfs", "dls50", "dls75", "dls100", "bibfs", "iddls"}
+
+def memo_key(env_seed, algo, cost_mode):
+    return (env_seed, algo, None if algo in COST_INDEPENDENT else cost_mode)
+
+def memo_run(memo, env_seed, grid, S, G, algo, cost_mode, trace_mem=False):
+    key = memo_key(env_seed, algo, cost_mode)
+    if key not in memo:
+        memo[key] = timed_run(grid, S, G, algo, cost_mode, trace_mem and cost_mode == 1)
+    return memo[key]
+
+MAP_KINDS = ["random", "solvable", "numpy"]
+
+def load_env_map(env_seed, maps="random"):
+    # "numpy": generador vectorizado de mapgen.py (otro stream de RNG) con cache en disco
+    if maps == "numpy":
+        import mapgen
+        cells, S, G = mapgen.load_or_generate(size=MAP_SIZE, p_frozen=P_FROZEN, seed=env_seed)
+        return mapgen.cells_to_desc(cells), S, G
+    return generate_random_map_custom(size=MAP_SIZE, p_frozen=P_FROZEN, seed=env_seed,
+                                      solvable=(maps == "solvable"))
+
+def eval_one_environment(env_seed, maps="random", instrument=False):
+    desc, S, G = load_env_map(env_seed, maps)
+    grid = Grid(desc)
+
+    memo = {}
     rows = []
     for algo in ALGORITHMS:
-        # 1)
-        t0 = time.perf_counter()
-        path1, actions1, explored1, g1 = run_algo(desc, S, G, algo, cost_mode=1)
-        t1 = time.perf_counter() - t0
-
-        # 2)
-        path2, actions2, explored2, g2 = run_algo(desc, S, G, algo, cost_mode=2)
-        actions_cost2 = cost_s2(actions2) if actions2 is not None else None
-        row = {
-            "algorithm_name": algo,
-            "env_n": env_seed,
-            "states_n": explored1,
-            "actions_count": len(actions1) if actions1 is not None else None,
-            "actions_cost": actions_cost2,
-            "time": t1,
-            "solution_found": (path1 is not None and path2 is not None)
-        }
-        rows.append(row)
+        r1 = memo_run(memo, env_seed, grid, S, G, algo, cost_mode=1, trace_mem=instrument)
+        r2 = memo_run(memo, env_seed, grid, S, G, algo, cost_mode=2)
+        rows.append(make_row(algo, env_seed, r1, r2))
     return rows
 
-def run_30_and_write_csv(out_path="../results.csv", n_envs=30, start_seed=0):
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+def slippery_row(env_seed, maps="random"):
+    # política óptima en el mapa resbaladizo (mdp.py) y su probabilidad de éxito desde S
+    import mdp
+    desc, S, G = load_env_map(env_seed, maps)
+    res = mdp.solve_map(desc, S, is_slippery=True)
+    return {
+        "algorithm_name": "vi_slippery",
+        "env_n": env_seed,
+        "states_n": res["iterations"],
+        "time": res["time"],
+        "solution_found": res["success_prob"] > 0,
+        "success_prob": res["success_prob"],
+    }
+
+# --- Modo paralelo: una tarea = (env_seed, algoritmo, cost_mode) ---
+@functools.lru_cache(maxsize=4)
+def load_env_grid(env_seed, maps="random"):
+    # cada worker regenera el mapa desde la semilla (determinista) y lo reutiliza
+    desc, S, G = load_env_map(env_seed, maps)
+    return Grid(desc), S, G
+
+def run_task(task, maps="random", instrument=False):
+    env_seed, algo, cost_mode = task
+    grid, S, G = load_env_grid(env_seed, maps)
+    return timed_run(grid, S, G, algo, cost_mode or 1, instrument and cost_mode != 2)
+
+def parallel_rows(seeds, workers, maps="random", instrument=False):
+    # tareas únicas según memo_key: los algoritmos sin costo van una sola vez
+    tasks = list(dict.fromkeys(memo_key(s, a, cm) for s in seeds for a in ALGORITHMS for cm in (1, 2)))
+    # con muchas semillas, un chunk = un mapa completo (aprovecha la cache del worker)
+    per_env = len(tasks) // len(seeds) if seeds else 1
+    chunksize = per_env if len(seeds) >= 4 * workers else 1
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        memo = {}
+        # ex.map conserva el orden de las tareas -> filas en orden estable
+        for task, res in zip(tasks, ex.map(functools.partial(run_task, maps=maps, instrument=instrument), tasks, chunksize=chunksize)):
+            memo[task] = res
+            env_seed, algo, cost_mode = task
+            if cost_mode != 1:
+                r1 = memo.pop(memo_key(env_seed, algo, 1))
+                yield make_row(algo, env_seed, r1, res)
+
+def run_30_and_write_csv(out_path="../results.csv", n_envs=30, start_seed=0, workers=1, maps="random",
+                         instrument=False, slippery=False):
+    if os.path.dirname(out_path):
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    seeds = range(start_seed, start_seed + n_envs)
     with open(out_path, "w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["algorithm_name","env_n","states_n","actions_count","actions_cost","time","solution_found"]
-        )
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
         writer.writeheader()
-        for env_seed in range(start_seed, start_seed + n_envs):
-            for row in eval_one_environment(env_seed):
-                writer.writerow(row)
+        if workers > 1:
+            # ojo: con varios procesos la columna time incluye la contención entre workers
+            writer.writerows(parallel_rows(seeds, workers, maps, instrument))
+        else:
+            for env_seed in seeds:
+                for row in eval_one_environment(env_seed, maps, instrument):
+                    writer.writerow(row)
+        if slippery:
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as ex:
+                    writer.writerows(ex.map(functools.partial(slippery_row, maps=maps), seeds))
+            else:
+                writer.writerows(slippery_row(env_seed, maps) for env_seed in seeds)
     print(f"Ergebnisse gespeichert in {out_path}")
 
-if __name__ == "__main__":
-    run_30_and_write_csv(out_path=OUT_CSV, n_envs=30, start_seed=0)
-
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--n_envs", type=int, default=30)
+    p.add_argument("--start_seed", type=int, default=0)
+    p.add_argument("--workers", type=int, default=1, help="procesos en paralelo (1 = serial)")
+    p.add_argument("--out", default=OUT_CSV)
+    p.add_argument("--maps", choices=MAP_KINDS, default="random",
+                   help="solvable: solo S/G conectados; numpy: generador de mapgen.py con cache")
+    p.add_argument("--instrument", action="store_true", help="mide además la memoria pico (tracemalloc)")
+    p.add_argument("--slippery", action="store_true",
+                   help="agrega por mapa una fila vi_slippery (value iteration, is_slippery=True)")
+    args = p.parse_args()
+    run_30_and_write_csv(out_path=args.out, n_envs=args.n_envs, start_seed=args.start_seed,
+                         workers=args.workers, maps=args.maps, instrument=args.instrument,
+                         slippery=args.slippery)
 
+if __name__ == "__main__":
+    main()
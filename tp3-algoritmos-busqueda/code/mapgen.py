@@ -0,0 +1,60 @@
+# Generador vectorizado de mapas FrozenLake + cache en disco (.npy)
+#
+# Stream de RNG: np.random.default_rng(seed) (PCG64). NO produce los mismos
+# mapas que generate_random_map_custom (random.Random), pero para un mismo
+# (size, p_frozen, seed) el mapa es siempre idéntico bit a bit:
+#   1) agujeros: rng.random() fila por fila, celda 'F' si < p_frozen
+#      (se genera por bloques de filas; el resultado no depende del bloque)
+#   2) S y luego G: rng.integers(0, size*size) en lotes de 64, primera
+#      celda libre (G distinta de S)
+# El mapa se guarda como uint8 con los códigos ASCII de 'F','H','S','G'.
+
+import os
+import numpy as np
+
+BASE_DIR  = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "maps_cache"))
+
+F, H, S, G = (ord(ch) for ch in "FHSG")
+_BLOCK_CELLS = 1 << 22
+
+def generate_map_np(size=100, p_frozen=0.92, seed=42):
+    rng = np.random.default_rng(seed)
+    cells = np.empty((size, size), dtype=np.uint8)
+    rows = max(1, _BLOCK_CELLS // size)
+    for r0 in range(0, size, rows):
+        block = rng.random((min(rows, size - r0), size)) < p_frozen
+        cells[r0:r0 + len(block)] = np.where(block, F, H)
+    flat = cells.reshape(-1)
+    picked = []
+    while len(picked) < 2:
+        for i in rng.integers(0, flat.size, size=64).tolist():
+            if flat[i] == F and i not in picked:
+                picked.append(i)
+                if len(picked) == 2:
+                    break
+    s, g = picked
+    flat[s], flat[g] = S, G
+    return cells, divmod(s, size), divmod(g, size)
+
+def cache_path(size, p_frozen, seed, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"map_{size}_{p_frozen!r}_{seed}.npy")
+
+def load_or_generate(size=100, p_frozen=0.92, seed=42, cache_dir=CACHE_DIR, mmap=True):
+    path = cache_path(size, p_frozen, seed, cache_dir)
+    if os.path.exists(path):
+        cells = np.load(path, mmap_mode="r" if mmap else None)
+        s = int(np.flatnonzero(cells.reshape(-1) == S)[0])
+        g = int(np.flatnonzero(cells.reshape(-1) == G)[0])
+        return cells, divmod(s, size), divmod(g, size)
+    cells, start, goal = generate_map_np(size, p_frozen, seed)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, cells)
+    os.replace(tmp, path)  # escritura atómica: varios workers pueden generar a la vez
+    return cells, start, goal
+
+def cells_to_desc(cells):
+    # formato de main.py: lista de strings, una por fila
+    return [row.tobytes().decode("ascii") for row in cells]
@@ -0,0 +1,182 @@
+# Value / policy iteration (NumPy) para FrozenLake resbaladizo
+#
+# Mismo modelo de transición que FrozenLake-v1 de gymnasium (env.P):
+#   - con is_slippery, la acción a mueve con prob 1/3 hacia a, (a-1)%4 y (a+1)%4
+#   - moverse fuera del mapa deja al agente en su celda
+#   - 'H' y 'G' son terminales; recompensa 1 solo al entrar en 'G'
+# Con gamma = 1, V[s] es la probabilidad de llegar a G desde s.
+#
+# Dos motores sobre el mismo modelo:
+#   - build_model(): arrays ralos nxt/prob de (n, 4, k) (k = 3 resbaladizo,
+#     1 determinista), como env.P; sirve para evaluar cualquier política y
+#     para policy_iteration()
+#   - grid_value_iteration(): el mismo backup de Bellman escrito como stencil
+#     sobre la grilla (vistas desplazadas de un array con borde), sin gathers;
+#     es el que usa solve_map (mapas 100x100 del barrido en ~0.3 s)
+# La política sale de greedy_policy(); con gamma = 1 desempata hacia G para
+# que la política realmente alcance la probabilidad V.
+#
+#   res = solve_map(desc, S)      # {"policy": (h, w), "success_prob": ..., ...}
+#   V, iters = evaluate_policy(build_model(desc), res["policy"].ravel())
+
+import time
+import numpy as np
+
+from main import MOVES
+
+def map_cells(desc):
+    # desc de main.py (lista de strings) o array uint8 de mapgen.py
+    if isinstance(desc, np.ndarray):
+        return np.asarray(desc, dtype=np.uint8)
+    cells = np.frombuffer("".join(desc).encode("ascii"), dtype=np.uint8)
+    return cells.reshape(len(desc), len(desc[0]))
+
+def slip_dirs(is_slippery):
+    return [[(a - 1) % 4, a, (a + 1) % 4] if is_slippery else [a] for a in range(4)]
+
+# --- modelo ralo (n, 4, k) ---
+def build_model(desc, is_slippery=True):
+    cells = map_cells(desc)
+    h, w = cells.shape
+    flat = cells.reshape(-1)
+    terminal = (flat == ord('H')) | (flat == ord('G'))
+    rr, cc = np.divmod(np.arange(h * w, dtype=np.int32), w)
+    # step[d] = celda a la que lleva moverse en la dirección d (se queda si sale)
+    step = np.empty((4, h * w), dtype=np.int32)
+    for d in range(4):
+        dr, dc = MOVES[d]
+        nr, nc = rr + dr, cc + dc
+        ok = (nr >= 0) & (nr < h) & (nc >= 0) & (nc < w)
+        step[d] = np.where(ok, nr * w + nc, rr * w + cc)
+    nxt = np.stack([step[dd].T for dd in slip_dirs(is_slippery)], axis=1)
+    nxt = np.ascontiguousarray(nxt)
+    nxt[terminal] = np.flatnonzero(terminal)[:, None, None]   # terminales: lazo
+    k = nxt.shape[2]
+    prob = np.full(nxt.shape, 1.0 / k)
+    reward = (flat == ord('G')).astype(np.float64)
+    R = (prob * reward[nxt]).sum(axis=2)     # recompensa esperada por (s, a)
+    R[terminal] = 0.0
+    return {"shape": (h, w), "step": step, "nxt": nxt, "prob": prob, "R": R,
+            "terminal": terminal, "goal": flat == ord('G')}
+
+def q_values(model, V, gamma=1.0):
+    Q = model["R"] + gamma * (model["prob"] * V[model["nxt"]]).sum(axis=2)
+    Q[model["terminal"]] = 0.0
+    return Q
+
+def value_iteration(model, gamma=1.0, tol=1e-8, max_iter=100000):
+    V = np.zeros(len(model["terminal"]))
+    for it in range(1, max_iter + 1):
+        V_new = q_values(model, V, gamma).max(axis=1)
+        delta = np.abs(V_new - V).max()
+        V = V_new
+        if delta < tol:
+            break
+    return V, greedy_policy(model, V, gamma), it
+
+def greedy_policy(model, V, gamma=1.0, slack=1e-12):
+    Q = q_values(model, V, gamma)
+    policy = Q.argmax(axis=1).astype(np.int8)
+    if gamma < 1:
+        return policy
+    # con gamma = 1 un empate puede elegir una acción que nunca avanza (p. ej.
+    # chocar contra el borde); cerca de V = 1 hay muchos empates exactos en
+    # float. Se asigna por capas desde G: cada estado toma, entre sus acciones
+    # óptimas, la que más destinos tiene en estados ya asignados.
+    ok = Q >= Q.max(axis=1, keepdims=True) - slack
+    done = model["terminal"] | (V <= slack)    # sin chance de llegar: da igual
+    target = model["goal"].copy()
+    new = np.flatnonzero(target)
+    while new.size:
+        cand = np.unique(model["step"][:, new])
+        cand = cand[~done[cand]]
+        hits = target[model["nxt"][cand]].sum(axis=2) * ok[cand]
+        sel = hits.any(axis=1)
+        new = cand[sel]
+        policy[new] = hits[sel].argmax(axis=1)
+        done[new] = target[new] = True
+    return policy
+
+def evaluate_policy(model, policy, gamma=1.0, tol=1e-8, max_iter=100000, V=None):
+    # evaluación iterativa de una política fija (prob de éxito con gamma = 1)
+    s = np.arange(len(policy))
+    nxt, prob = model["nxt"][s, policy], model["prob"][s, policy]
+    R = model["R"][s, policy]
+    live = ~model["terminal"]
+    V = np.zeros(len(policy)) if V is None else V.copy()
+    for it in range(1, max_iter + 1):
+        V_new = np.where(live, R + gamma * (prob * V[nxt]).sum(axis=1), 0.0)
+        delta = np.abs(V_new - V).max()
+        V = V_new
+        if delta < tol:
+            break
+    return V, it
+
+def policy_iteration(model, gamma=1.0, tol=1e-8, eval_sweeps=50, max_iter=100000):
+    # policy iteration modificada: evaluación parcial (eval_sweeps barridos,
+    # arrancando del V anterior) + mejora greedy, hasta que V se estabiliza
+    n = len(model["terminal"])
+    policy = np.zeros(n, dtype=np.int8)
+    V, sweeps = np.zeros(n), 0
+    while sweeps < max_iter:
+        V_old = V
+        V, k = evaluate_policy(model, policy, gamma, tol, eval_sweeps, V=V)
+        sweeps += k
+        Q = q_values(model, V, gamma)
+        # solo se cambia la acción si mejora de verdad (evita ciclar entre empates)
+        better = Q.max(axis=1) > Q[np.arange(n), policy] + tol
+        policy = np.where(better, Q.argmax(axis=1), policy).astype(np.int8)
+        if not better.any() and np.abs(V - V_old).max() < tol:
+            break
+    return V, greedy_policy(model, V, gamma), sweeps
+
+# --- mismo backup como stencil sobre la grilla ---
+def grid_value_iteration(desc, is_slippery=True, gamma=1.0, tol=1e-8, max_iter=100000):
+    # T = recompensa al entrar + gamma * V (V = 0 en terminales). Vecinos por
+    # dirección = vistas de un array con borde; el borde copia la fila/columna
+    # de al lado (chocar contra el borde = quedarse en la celda).
+    # Resbaladizo: Q_a = (suma de los 4 T - T opuesto a a) / 3, así que
+    # max_a Q_a = (suma - min) / 3. Determinista: max_a Q_a = max de los 4 T.
+    cells = map_cells(desc)
+    h, w = cells.shape
+    goal = (cells == ord('G')).astype(np.float64)
+    live = ((cells != ord('H')) & (cells != ord('G'))).astype(np.float64)
+    pad = np.zeros((h + 2, w + 2))
+    inner = pad[1:-1, 1:-1]
+    nb = (pad[1:-1, :-2], pad[2:, 1:-1], pad[1:-1, 2:], pad[:-2, 1:-1])   # orden de MOVES
+    V = np.zeros((h, w))
+    for it in range(1, max_iter + 1):
+        np.multiply(V, gamma, out=inner)
+        inner += goal
+        pad[0, 1:-1], pad[-1, 1:-1] = inner[0], inner[-1]
+        pad[1:-1, 0], pad[1:-1, -1] = inner[:, 0], inner[:, -1]
+        if is_slippery:
+            V_new = nb[0] + nb[1] + nb[2] + nb[3]
+            V_new -= np.minimum(np.minimum(nb[0], nb[1]), np.minimum(nb[2], nb[3]))
+            V_new /= 3
+        else:
+            V_new = np.maximum(np.maximum(nb[0], nb[1]), np.maximum(nb[2], nb[3]))
+        V_new *= live
+        delta = np.abs(V_new - V).max()
+        V = V_new
+        if delta < tol:
+            break
+    return V, it
+
+def solve_map(desc, start, is_slippery=True, method="vi", gamma=1.0, tol=1e-8):
+    # política y probabilidad de éxito desde start para un mapa
+    t0 = time.perf_counter()
+    model = build_model(desc, is_slippery)
+    h, w = model["shape"]
+    if method == "vi":
+        V, iters = grid_value_iteration(desc, is_slippery, gamma, tol)
+        policy = greedy_policy(model, V.ravel(), gamma)
+    else:
+        V, policy, iters = policy_iteration(model, gamma, tol)
+    return {
+        "policy": policy.reshape(h, w),
+        "V": V.reshape(h, w),
+        "success_prob": float(V.reshape(h, w)[start]),
+        "iterations": iters,
+        "time": time.perf_counter() - t0,
+    }
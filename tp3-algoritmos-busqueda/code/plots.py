@@ -1,40 +1,176 @@
-import os, csv, math
+import os, csv, math, argparse, shutil, tempfile, zipfile
+import numpy as np
 import matplotlib.pyplot as plt
 
 CSV_PATH = os.path.join(os.path.dirname(__file__), "..", "results.csv")
 IMG_DIR  = os.path.join(os.path.dirname(__file__), "..", "images")
-os.makedirs(IMG_DIR, exist_ok=True)
-
-ALGO_ORDER = ["random", "bfs", "dfs", "dls50", "dls75", "dls100", "ucs", "astar"]
-
-data = {a: {"states_n": [], "actions_count": [], "actions_cost": [], "time": []} for a in ALGO_ORDER}
-
-with open(CSV_PATH, newline="") as f:
-    r = csv.DictReader(f)
-    for row in r:
-        algo = row["algorithm_name"]
-        if algo not in data:
-            continue
-        def to_num(x):
-            if x is None or x == "" or x.lower() == "none":
-                return None
-            try:
-                return float(x)
-            except:
-                return None
-
-        sn  = to_num(row["states_n"])
-        tm  = to_num(row["time"])
-        ac1 = to_num(row["actions_count"])
-        ac2 = to_num(row["actions_cost"])
-
-        if sn is not None:  data[algo]["states_n"].append(sn)
-        if tm is not None:  data[algo]["time"].append(tm)
-        if ac1 is not None: data[algo]["actions_count"].append(ac1)
-        if ac2 is not None: data[algo]["actions_cost"].append(ac2)
-
-def boxplot_metric(metric, ylabel, filename):
-    vals = [data[a][metric] for a in ALGO_ORDER]
+
+ALGO_ORDER = ["random", "bfs", "dfs", "dls50", "dls75", "dls100", "ucs", "astar", "bibfs", "biastar", "jps", "ucs_dial", "astar_dial", "iddls", "idastar", "arastar"]
+
+# métricas de instrumentación (columnas opcionales de main.py)
+EXTRA_METRICS = ["pushes", "peak_frontier", "peak_mem_kb"]
+METRICS = ["states_n", "actions_count", "actions_cost", "time"] + EXTRA_METRICS
+
+def to_num(x):
+    # celdas vacías / "None" / no numéricas -> nan (se descartan al agregar)
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return math.nan
+
+# --- lectura por bloques: cada bloque = {columna: array} ---
+def read_csv_chunks(path, chunk_size):
+    with open(path, newline="") as f:
+        r = csv.DictReader(f)
+        cols = [m for m in METRICS if m in r.fieldnames]
+        while True:
+            rows = [row for _, row in zip(range(chunk_size), r)]
+            if not rows:
+                return
+            chunk = {"algorithm_name": np.array([row["algorithm_name"] for row in rows])}
+            for m in cols:
+                chunk[m] = np.array([to_num(row[m]) for row in rows], dtype=np.float64)
+            yield chunk
+
+def read_npz_chunks(path, chunk_size):
+    # cada columna es un .npy dentro del zip; se lee de a chunk_size filas
+    # directamente del miembro (np.load cargaría la columna entera)
+    with zipfile.ZipFile(path) as zf:
+        members = {os.path.splitext(m)[0]: m for m in zf.namelist()}
+        files, dtypes, n = {}, {}, 0
+        for c in ["algorithm_name"] + METRICS:
+            if c not in members:
+                continue
+            f = files[c] = zf.open(members[c])
+            version = np.lib.format.read_magic(f)
+            read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+            shape, _, dtypes[c] = read_header(f)
+            n = shape[0]
+        for i in range(0, n, chunk_size):
+            k = min(chunk_size, n - i)
+            yield {c: np.frombuffer(f.read(k * dtypes[c].itemsize), dtype=dtypes[c]) for c, f in files.items()}
+
+def read_parquet_chunks(path, chunk_size):
+    import pyarrow.parquet as pq   # opcional: solo para resultados en Parquet
+    pf = pq.ParquetFile(path)
+    cols = [c for c in ["algorithm_name"] + METRICS if c in pf.schema_arrow.names]
+    for batch in pf.iter_batches(batch_size=chunk_size, columns=cols):
+        chunk = {}
+        for c in cols:
+            col = batch.column(c)
+            if c == "algorithm_name":
+                chunk[c] = np.array(col.to_pylist())
+            else:
+                chunk[c] = col.cast("double").to_numpy(zero_copy_only=False)
+        yield chunk
+
+READERS = {".csv": read_csv_chunks, ".npz": read_npz_chunks, ".parquet": read_parquet_chunks}
+
+def read_chunks(path, chunk_size=50000):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unbekanntes Format: {path}")
+    return READERS[ext](path, chunk_size)
+
+# --- estadísticas en streaming ---
+class RunningStats:
+    # Welford; cada bloque se combina con la fórmula de Chan (mismo resultado)
+    def __init__(self):
+        self.n, self.mean, self.m2 = 0, 0.0, 0.0
+
+    def add(self, xs):
+        nb = len(xs)
+        if not nb:
+            return
+        mb = float(xs.mean())
+        m2b = float(((xs - mb) ** 2).sum())
+        n = self.n + nb
+        d = mb - self.mean
+        self.mean += d * nb / n
+        self.m2 += m2b + d * d * self.n * nb / n
+        self.n = n
+
+    def mean_std(self):
+        if not self.n: return (math.nan, math.nan)
+        return (self.mean, math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0)
+
+class Reservoir:
+    # muestra uniforme de tamaño k (algoritmo R), reproducible por semilla
+    def __init__(self, k, rng):
+        self.k, self.rng = k, rng
+        self.buf = np.empty(k)
+        self.seen = 0
+
+    def add(self, xs):
+        take = min(len(xs), max(self.k - self.seen, 0))
+        self.buf[self.seen:self.seen + take] = xs[:take]
+        rest = xs[take:]
+        if len(rest):
+            t = self.seen + take + np.arange(len(rest))      # índice global de cada valor
+            j = (self.rng.random(len(rest)) * (t + 1)).astype(np.int64)
+            hit = j < self.k
+            # si dos valores caen en el mismo lugar gana el último, como en el loop
+            slots, vals = j[hit][::-1], rest[hit][::-1]
+            slots, first = np.unique(slots, return_index=True)
+            self.buf[slots] = vals[first]
+        self.seen += len(xs)
+
+    def sample(self):
+        return self.buf[:min(self.seen, self.k)]
+
+def aggregate(path, chunk_size=50000, reservoir=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    stats = {(a, m): RunningStats() for a in ALGO_ORDER for m in METRICS}
+    samples = {(a, m): Reservoir(reservoir, rng) for a in ALGO_ORDER for m in METRICS}
+    for chunk in read_chunks(path, chunk_size):
+        names = chunk["algorithm_name"]
+        for a in ALGO_ORDER:
+            sel = names == a
+            if not sel.any():
+                continue
+            for m in METRICS:
+                if m not in chunk:
+                    continue
+                xs = chunk[m][sel]
+                xs = xs[~np.isnan(xs)]
+                stats[a, m].add(xs)
+                samples[a, m].add(xs)
+    return stats, samples
+
+def convert(path, out, chunk_size=50000):
+    # resultados -> .npz columnar (algorithm_name + métricas como float64, nan = vacío)
+    # 1a pasada: filas y ancho de los nombres; 2a: cada bloque se escribe en un
+    # .npy mapeado en disco por columna, que después se empaquetan en el zip
+    n, width = 0, 1
+    for chunk in read_chunks(path, chunk_size):
+        names = chunk["algorithm_name"]
+        n += len(names)
+        if len(names):
+            width = max(width, int(np.char.str_len(names.astype(str)).max()))
+    cols = ["algorithm_name"] + METRICS
+    tmp = tempfile.mkdtemp()
+    try:
+        arrs = {c: np.lib.format.open_memmap(os.path.join(tmp, c + ".npy"), mode="w+",
+                                              dtype=f"<U{width}" if c == "algorithm_name" else np.float64, shape=(n,))
+                for c in cols}
+        i = 0
+        for chunk in read_chunks(path, chunk_size):
+            k = len(chunk["algorithm_name"])
+            for c in cols:
+                arrs[c][i:i + k] = chunk.get(c, np.nan)
+            i += k
+        for a in arrs.values():
+            a.flush()
+        del arrs
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for c in cols:
+                zf.write(os.path.join(tmp, c + ".npy"), c + ".npy")
+    finally:
+        shutil.rmtree(tmp)
+    print(f"Gespeichert: {out}")
+
+def boxplot_metric(samples, metric, ylabel, filename):
+    vals = [samples[a, metric].sample() for a in ALGO_ORDER]
     labels = ALGO_ORDER
     filtered = [(lab, v) for lab, v in zip(labels, vals) if len(v) > 0]
     if not filtered:
@@ -53,29 +189,44 @@ def boxplot_metric(metric, ylabel, filename):
     plt.close()
     print(f"Gespeichert: {out}")
 
-def mean_std(xs):
-    if not xs: return (math.nan, math.nan)
-    m = sum(xs)/len(xs)
-    v = sum((x-m)**2 for x in xs)/(len(xs)-1) if len(xs) > 1 else 0.0
-    return (m, math.sqrt(v))
-
-boxplot_metric("states_n",     "Explorierte Zustände (S1)", "box_states_n.png")
-boxplot_metric("actions_count","Anzahl Aktionen (S1)",      "box_actions_count.png")
-boxplot_metric("actions_cost", "Aktionskosten (S2)",        "box_actions_cost.png")
-boxplot_metric("time",         "Zeit [s] (S1)",             "box_time.png")
-
-stats_path = os.path.join(IMG_DIR, "summary_stats.txt")
-with open(stats_path, "w") as f:
-    for a in ALGO_ORDER:
-        s = data[a]["states_n"];  m_s, sd_s = mean_std(s)
-        ac = data[a]["actions_count"]; m_ac, sd_ac = mean_std(ac)
-        c2 = data[a]["actions_cost"];  m_c2, sd_c2 = mean_std(c2)
-        t  = data[a]["time"];          m_t, sd_t  = mean_std(t)
-        f.write(
-            f"{a}\n"
-            f"- states_n (S1): mean={m_s:.2f}, std={sd_s:.2f}, n={len(s)}\n"
-            f"- actions_count (S1): mean={m_ac:.2f}, std={sd_ac:.2f}, n={len(ac)}\n"
-            f"- actions_cost (S2): mean={m_c2:.2f}, std={sd_c2:.2f}, n={len(c2)}\n"
-            f"- time [s] (S1): mean={m_t:.4f}, std={sd_t:.4f}, n={len(t)}\n\n"
-        )
-print(f"Statistik gespeichert: {stats_path}")
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("path", nargs="?", default=CSV_PATH, help="results.csv, .npz o .parquet")
+    p.add_argument("--chunk", type=int, default=50000, help="filas por bloque")
+    p.add_argument("--reservoir", type=int, default=2000, help="muestras por (algoritmo, métrica) para los boxplots")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--convert", metavar="OUT.npz", help="solo convierte los resultados a .npz")
+    args = p.parse_args()
+    if args.convert:
+        convert(args.path, args.convert, args.chunk)
+        return
+
+    os.makedirs(IMG_DIR, exist_ok=True)
+    stats, samples = aggregate(args.path, args.chunk, args.reservoir, args.seed)
+
+    boxplot_metric(samples, "states_n",     "Explorierte Zustände (S1)", "box_states_n.png")
+    boxplot_metric(samples, "actions_count","Anzahl Aktionen (S1)",      "box_actions_count.png")
+    boxplot_metric(samples, "actions_cost", "Aktionskosten (S2)",        "box_actions_cost.png")
+    boxplot_metric(samples, "time",         "Zeit [s] (S1)",             "box_time.png")
+    boxplot_metric(samples, "pushes",       "Pushes (S1)",               "box_pushes.png")
+    boxplot_metric(samples, "peak_frontier","Max. Frontier (S1)",        "box_peak_frontier.png")
+    boxplot_metric(samples, "peak_mem_kb",  "Speicher-Peak [KiB] (S1)",  "box_peak_mem.png")
+
+    stats_path = os.path.join(IMG_DIR, "summary_stats.txt")
+    with open(stats_path, "w") as f:
+        for a in ALGO_ORDER:
+            s = stats[a, "states_n"];       m_s, sd_s = s.mean_std()
+            ac = stats[a, "actions_count"]; m_ac, sd_ac = ac.mean_std()
+            c2 = stats[a, "actions_cost"];  m_c2, sd_c2 = c2.mean_std()
+            t  = stats[a, "time"];          m_t, sd_t  = t.mean_std()
+            f.write(
+                f"{a}\n"
+                f"- states_n (S1): mean={m_s:.2f}, std={sd_s:.2f}, n={s.n}\n"
+                f"- actions_count (S1): mean={m_ac:.2f}, std={sd_ac:.2f}, n={ac.n}\n"
+                f"- actions_cost (S2): mean={m_c2:.2f}, std={sd_c2:.2f}, n={c2.n}\n"
+                f"- time [s] (S1): mean={m_t:.4f}, std={sd_t:.4f}, n={t.n}\n\n"
+            )
+    print(f"Statistik gespeichert: {stats_path}")
+
+if __name__ == "__main__":
+    main()
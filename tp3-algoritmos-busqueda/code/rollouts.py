@@ -0,0 +1,129 @@
+# Validación de planes: re-ejecuta las acciones de run_algo en FrozenLake
+#
+# Cada plan = (desc, S, actions). Se ejecutan todos juntos, en lote:
+#   - backend "numpy": las mismas reglas de FrozenLake-v1 determinista
+#     (chocar contra el borde = quedarse, 'H' y 'G' terminan el episodio,
+#     TimeLimit de max_steps) sobre arrays (B,), un paso para todos a la vez
+#   - backend "gym": SyncVectorEnv de envs creados con make_env (referencia)
+# Un plan es válido si llega a G en <= max_steps pasos.
+#
+#   res = validate_plans(plans, max_steps=1000)
+#   res["reached"], res["steps"], res["plans_per_s"]
+#
+#   python rollouts.py --n_envs 30 --backend numpy
+
+import time, argparse
+import numpy as np
+
+from main import MOVES, ALGORITHMS, MAP_KINDS, Grid, load_env_map, make_env, run_algo
+
+DR = np.array([MOVES[a][0] for a in range(4)], dtype=np.int64)
+DC = np.array([MOVES[a][1] for a in range(4)], dtype=np.int64)
+
+def pad_actions(plans):
+    # (B, T) con -1 después del final de cada plan
+    T = max((len(p[2]) for p in plans), default=0)
+    acts = np.full((len(plans), T), -1, dtype=np.int8)
+    for b, (_, _, actions) in enumerate(plans):
+        acts[b, :len(actions)] = actions
+    return acts
+
+def rollout_numpy(plans, max_steps=1000):
+    descs = [p[0] for p in plans]
+    h, w = len(descs[0]), len(descs[0][0])
+    if any(len(d) != h or len(d[0]) != w for d in descs):
+        raise ValueError("rollout_numpy: todos los mapas deben tener el mismo tamaño")
+    B = len(plans)
+    cells = np.frombuffer("".join("".join(d) for d in descs).encode("ascii"), dtype=np.uint8)
+    cells = cells.reshape(B, h * w)
+    acts = pad_actions(plans)
+    r = np.array([p[1][0] for p in plans], dtype=np.int64)
+    c = np.array([p[1][1] for p in plans], dtype=np.int64)
+    rows = np.arange(B)
+    reached = np.zeros(B, dtype=bool)
+    alive = np.ones(B, dtype=bool)
+    steps = np.zeros(B, dtype=np.int64)
+    for t in range(min(acts.shape[1], max_steps)):
+        a = acts[:, t]
+        act = alive & (a >= 0)
+        if not act.any():
+            break
+        b = rows[act]
+        a = a[act]
+        r[b] = np.clip(r[b] + DR[a], 0, h - 1)
+        c[b] = np.clip(c[b] + DC[a], 0, w - 1)
+        steps[b] += 1
+        cell = cells[b, r[b] * w + c[b]]
+        reached[b] = cell == ord('G')
+        alive[b] = (cell != ord('G')) & (cell != ord('H'))
+    return reached, steps
+
+def rollout_gym(plans, max_steps=1000):
+    from gymnasium.vector import SyncVectorEnv
+    B = len(plans)
+    env = SyncVectorEnv([lambda d=p[0]: make_env(d, max_steps=max_steps) for p in plans])
+    env.reset(seed=list(range(B)))
+    acts = pad_actions(plans)
+    reached = np.zeros(B, dtype=bool)
+    alive = np.ones(B, dtype=bool)
+    steps = np.zeros(B, dtype=np.int64)
+    for t in range(acts.shape[1]):
+        act = alive & (acts[:, t] >= 0)
+        if not act.any():
+            break
+        # los envs terminados reciben una acción cualquiera (autoreset) y se ignoran
+        _, reward, term, trunc, _ = env.step(np.where(act, acts[:, t], 0).astype(np.int64))
+        steps[act] += 1
+        reached[act] = reward[act] > 0
+        alive[act] = ~(term[act] | trunc[act])
+    env.close()
+    return reached, steps
+
+BACKENDS = {"numpy": rollout_numpy, "gym": rollout_gym}
+
+def validate_plans(plans, max_steps=1000, backend="numpy"):
+    # plans: [(desc, S, actions), ...]; planes sin solución no se ejecutan
+    t0 = time.perf_counter()
+    reached, steps = BACKENDS[backend](plans, max_steps) if plans else (np.zeros(0, bool), np.zeros(0, int))
+    elapsed = time.perf_counter() - t0
+    return {
+        "reached": reached,
+        "steps": steps,
+        "time": elapsed,
+        "plans_per_s": len(plans) / elapsed if elapsed > 0 else float("inf"),
+        "steps_per_s": int(steps.sum()) / elapsed if elapsed > 0 else float("inf"),
+    }
+
+def collect_plans(seeds, algos, cost_modes=(1, 2), maps="random"):
+    plans, keys = [], []
+    for env_seed in seeds:
+        desc, S, G = load_env_map(env_seed, maps)
+        grid = Grid(desc)
+        for algo in algos:
+            for cm in cost_modes:
+                _, actions, _, _ = run_algo(grid, S, G, algo, cm)
+                if actions is not None:
+                    plans.append((desc, S, actions))
+                    keys.append((env_seed, algo, cm))
+    return plans, keys
+
+def main():
+    p = argparse.ArgumentParser()
+    p.add_argument("--n_envs", type=int, default=30)
+    p.add_argument("--start_seed", type=int, default=0)
+    p.add_argument("--algos", default=",".join(ALGORITHMS))
+    p.add_argument("--maps", choices=MAP_KINDS, default="random")
+    p.add_argument("--max_steps", type=int, default=1000)
+    p.add_argument("--backend", choices=sorted(BACKENDS), default="numpy")
+    args = p.parse_args()
+    seeds = range(args.start_seed, args.start_seed + args.n_envs)
+    plans, keys = collect_plans(seeds, args.algos.split(","), maps=args.maps)
+    res = validate_plans(plans, args.max_steps, args.backend)
+    bad = [k for k, ok in zip(keys, res["reached"]) if not ok]
+    print(f"{len(plans)} Pläne, {len(plans) - len(bad)} erreichen G ({args.backend}: "
+          f"{res['plans_per_s']:.0f} Pläne/s, {res['steps_per_s']:.0f} Schritte/s)")
+    for env_seed, algo, cm in bad:
+        print(f"  FEHLER: env={env_seed} algo={algo} cost_mode={cm}")
+
+if __name__ == "__main__":
+    main()
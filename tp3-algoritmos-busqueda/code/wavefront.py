@@ -0,0 +1,108 @@
+# Wavefront BFS vectorizado (NumPy) para mapas de distancia completos
+#
+# En vez de expandir nodo por nodo como bfs()/ucs() de main.py, cada paso
+# expande toda la frontera a la vez con operaciones sobre arrays de índices.
+# La grilla se rellena con un borde de agujeros, así los vecinos de una celda
+# libre siempre son índices válidos y no hace falta chequear límites.
+#
+#   free = free_mask(desc)
+#   dist = distance_grid(free, [S], cost_mode=2)      # int32 (h, w), INF = inalcanzable
+#   path, actions = path_from_grid(dist, G, cost_mode=2)   # camino G -> S
+
+import numpy as np
+
+from main import ACTION_COSTS, INF, MOVES
+
+def free_mask(desc):
+    # desc de main.py (lista de strings) o array uint8 de mapgen.py
+    if isinstance(desc, np.ndarray):
+        return np.asarray(desc) != ord('H')
+    cells = np.frombuffer("".join(desc).encode("ascii"), dtype=np.uint8)
+    return (cells != ord('H')).reshape(len(desc), len(desc[0]))
+
+def _padded(free):
+    h, w = free.shape
+    pad = np.zeros((h + 2, w + 2), dtype=bool)
+    pad[1:-1, 1:-1] = free
+    W = w + 2
+    # desplazamiento del índice plano por acción, mismo orden que MOVES
+    offs = np.array([dr * W + dc for dr, dc in (MOVES[a] for a in range(4))], dtype=np.int32)
+    return pad.ravel(), offs, W
+
+class _Dedupe:
+    # quita índices repetidos en O(k) sin ordenar: cada celda anota su última
+    # posición en slot y se queda solo la aparición que coincide
+    def __init__(self, n):
+        self.slot = np.empty(n, dtype=np.int32)
+        self.ar = np.arange(1024, dtype=np.int32)
+
+    def __call__(self, cand):
+        k = cand.size
+        if k > self.ar.size:
+            self.ar = np.arange(2 * k, dtype=np.int32)
+        ar = self.ar[:k]
+        self.slot[cand] = ar
+        return cand[self.slot[cand] == ar]
+
+def distance_grid(free, sources, cost_mode=1):
+    h, w = free.shape
+    pfree, offs, W = _padded(free)
+    dedupe = _Dedupe(pfree.size)
+    dist = np.full(pfree.size, INF, dtype=np.int32)
+    src = dedupe(np.array([(r + 1) * W + (c + 1) for r, c in sources], dtype=np.int32))
+    src = src[pfree[src]]
+    dist[src] = 0
+    if cost_mode == 1:
+        frontier, d = src, 0
+        while frontier.size:
+            d += 1
+            cand = (frontier[:, None] + offs).ravel()
+            cand = dedupe(cand[pfree[cand] & (dist[cand] == INF)])
+            dist[cand] = d
+            frontier = cand
+    else:
+        # Dial por capas: buckets[d] = celdas que alcanzaron distancia d
+        costs = ACTION_COSTS[cost_mode]
+        groups = [(c, offs[[a for a in range(4) if costs[a] == c]]) for c in sorted(set(costs))]
+        buckets = {0: [src]}
+        d = 0
+        while buckets:
+            if d not in buckets:
+                d = min(buckets)
+            cells = dedupe(np.concatenate(buckets.pop(d)))
+            cells = cells[dist[cells] == d]
+            for c, o in groups:
+                cand = (cells[:, None] + o).ravel()
+                cand = cand[pfree[cand]]
+                cand = dedupe(cand[dist[cand] > d + c])
+                if cand.size:
+                    dist[cand] = d + c
+                    buckets.setdefault(d + c, []).append(cand)
+            d += 1
+    return dist.reshape(h + 2, w + 2)[1:-1, 1:-1].copy()
+
+def path_from_grid(dist, start, cost_mode=1):
+    # baja por el gradiente desde start hasta una fuente (dist 0);
+    # devuelve (path, actions) como main.reconstruct, o (None, None)
+    h, w = dist.shape
+    costs = ACTION_COSTS[cost_mode]
+    r, c = start
+    if dist[r, c] == INF:
+        return None, None
+    path, actions = [(r, c)], []
+    while dist[r, c]:
+        for a in range(4):
+            dr, dc = MOVES[a]
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < h and 0 <= nc < w and int(dist[nr, nc]) + costs[a] == dist[r, c]:
+                break
+        r, c = nr, nc
+        path.append((r, c))
+        actions.append(a)
+    return path, actions
+
+def analyze_map(desc, S, G):
+    # mapas de distancia desde S y desde G para ambos cost modes
+    free = free_mask(desc)
+    return {(name, cm): distance_grid(free, [pos], cm)
+            for name, pos in (("S", S), ("G", G)) for cm in (1, 2)}
@@ -4,11 +4,15 @@
 #   make sa    → Simulated Annealing
 #   make ga    → Algoritmo Genético
 #   make rand  → Búsqueda Aleatoria
+#   make mc    → Min-conflicts (N = 10^6)
+#   make mc-scaling → tiempo de min-conflicts para N = 10^2 .. 10^6
 # Resultados en carpeta tp4-busquedas-locales
 
 import argparse, time, random, math, csv, statistics
 from pathlib import Path
 
+import numpy as np
+
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -19,60 +23,154 @@ def project_root():
 def random_board(n, rng):
     return [rng.randrange(n) for _ in range(n)]
 
+class Board:
+    # tablero + contadores de reinas por fila y por diagonal:
+    # H = suma de C(k, 2) sobre cada línea (una columna tiene una sola reina)
+    __slots__ = ("n", "rows", "row_cnt", "d1_cnt", "d2_cnt", "h")
+
+    def __init__(self, board):
+        n = self.n = len(board)
+        self.rows = list(board)
+        self.row_cnt = [0] * n
+        self.d1_cnt = [0] * (2 * n - 1)   # r - c + n - 1
+        self.d2_cnt = [0] * (2 * n - 1)   # r + c
+        h = 0
+        for c, r in enumerate(self.rows):
+            h += self.row_cnt[r] + self.d1_cnt[r - c + n - 1] + self.d2_cnt[r + c]
+            self.row_cnt[r] += 1
+            self.d1_cnt[r - c + n - 1] += 1
+            self.d2_cnt[r + c] += 1
+        self.h = h
+
+    def delta(self, c, r):
+        # cambio de H al mover la reina de la columna c a la fila r, en O(1)
+        r0 = self.rows[c]
+        if r == r0:
+            return 0
+        n = self.n
+        removed = self.row_cnt[r0] + self.d1_cnt[r0 - c + n - 1] + self.d2_cnt[r0 + c] - 3
+        return self.row_cnt[r] + self.d1_cnt[r - c + n - 1] + self.d2_cnt[r + c] - removed
+
+    def move(self, c, r):
+        r0 = self.rows[c]
+        if r == r0:
+            return
+        n = self.n
+        self.h += self.delta(c, r)
+        self.row_cnt[r0] -= 1
+        self.d1_cnt[r0 - c + n - 1] -= 1
+        self.d2_cnt[r0 + c] -= 1
+        self.row_cnt[r] += 1
+        self.d1_cnt[r - c + n - 1] += 1
+        self.d2_cnt[r + c] += 1
+        self.rows[c] = r
+
 def H(board):
-    n = len(board)
-    h = 0
-    for c1 in range(n):
-        r1 = board[c1]
-        for c2 in range(c1 + 1, n):
-            r2 = board[c2]
-            if r1 == r2 or abs(r1 - r2) == abs(c1 - c2):
-                h += 1
-    return h
+    return Board(board).h
 
-def best_neighbor(board, rng):
-    n = len(board)
-    current_h = H(board)
+def best_move(state, rng):
+    # todos los movimientos (c, r) con el menor H <= H actual; empates al azar con rng
+    n = state.n
+    rows, row_cnt, d1_cnt, d2_cnt = state.rows, state.row_cnt, state.d1_cnt, state.d2_cnt
+    current_h = state.h
     best_h = current_h
     bests = []
     for c in range(n):
-        r_orig = board[c]
+        r_orig = rows[c]
+        base = current_h - (row_cnt[r_orig] + d1_cnt[r_orig - c + n - 1] + d2_cnt[r_orig + c] - 3)
         for r in range(n):
             if r == r_orig:
                 continue
-            board[c] = r
-            val = H(board)
+            val = base + row_cnt[r] + d1_cnt[r - c + n - 1] + d2_cnt[r + c]
             if val < best_h:
                 best_h = val
                 bests = [(c, r)]
             elif val == best_h:
                 bests.append((c, r))
-        board[c] = r_orig
     if not bests:
-        return board[:], current_h, False
-    c, r = rng.choice(bests)
+        return None, current_h
+    return rng.choice(bests), best_h
+
+def best_neighbor(board, rng):
+    move, best_h = best_move(Board(board), rng)
+    if move is None:
+        return board[:], best_h, False
+    c, r = move
+    nb = board[:]
+    nb[c] = r
+    return nb, best_h, True
+
+# --- vecindario completo vectorizado (NumPy) ---
+_DIAG_IDX = {}
+
+def diag_index(n):
+    # índices de diagonal de cada casilla (c, r): r - c + n - 1 y r + c
+    if n not in _DIAG_IDX:
+        c = np.arange(n, dtype=np.int32)[:, None]
+        r = np.arange(n, dtype=np.int32)[None, :]
+        _DIAG_IDX.clear()
+        _DIAG_IDX[n] = (r - c + n - 1, r + c)
+    return _DIAG_IDX[n]
+
+def delta_matrix(state):
+    # D[c, r] = cambio de H al mover la reina de la columna c a la fila r (0 si ya está ahí)
+    n = state.n
+    i1, i2 = diag_index(n)
+    rows = np.array(state.rows, dtype=np.int32)
+    cols = np.arange(n, dtype=np.int32)
+    row_cnt = np.array(state.row_cnt, dtype=np.int32)
+    d1_cnt = np.array(state.d1_cnt, dtype=np.int32)
+    d2_cnt = np.array(state.d2_cnt, dtype=np.int32)
+    removed = row_cnt[rows] + d1_cnt[rows - cols + n - 1] + d2_cnt[rows + cols] - 3
+    D = d1_cnt[i1]
+    D += d2_cnt[i2]
+    D += row_cnt[None, :]
+    D -= removed[:, None]
+    D[cols, rows] = 0
+    return D
+
+def best_move_np(state, rng):
+    # igual que best_move (mismo orden de empates y misma llamada a rng), en una pasada
+    n = state.n
+    D = delta_matrix(state)
+    D[np.arange(n), state.rows] = 3 * n      # quedarse quieto no es un movimiento
+    best = int(D.min()) if n > 1 else 1
+    if best > 0:
+        return None, state.h
+    ties = np.flatnonzero(D.ravel() == best)
+    return divmod(int(rng.choice(ties)), n), state.h + best
+
+def best_neighbor_np(board, rng):
+    move, best_h = best_move_np(Board(board), rng)
+    if move is None:
+        return board[:], best_h, False
+    c, r = move
     nb = board[:]
     nb[c] = r
     return nb, best_h, True
 
+# desde este N, hill_climbing usa best_move_np (mismo resultado, más rápido)
+NP_MIN_N = 32
+
 def hill_climbing(n, max_states, seed, return_history=False):
     rng = random.Random(seed)
-    board = random_board(n, rng)
+    state = Board(random_board(n, rng))
     states = 1
     start = time.time()
-    history = [H(board)] if return_history else None
+    history = [state.h] if return_history else None
+    find_move = best_move_np if n >= NP_MIN_N else best_move
     while states < max_states:
-        if H(board) == 0:
+        if state.h == 0:
             break
-        nb, nb_h, improved = best_neighbor(board, rng)
-        if not improved:
+        move, nb_h = find_move(state, rng)
+        if move is None:
             break
-        board = nb
+        state.move(*move)
         states += 1
         if return_history:
             history.append(nb_h)
     elapsed = time.time() - start
-    return board, H(board), states, elapsed, (history if return_history else None)
+    return state.rows, state.h, states, elapsed, (history if return_history else None)
 
 def random_search(n, max_states, seed, return_history=False):
     rng = random.Random(seed)
@@ -105,26 +203,26 @@ def neighbors_for_sa(board, rng):
 
 def simulated_annealing(n, max_states, seed, T0=1.0, alpha=0.995, Tmin=1e-4, return_history=False):
     rng = random.Random(seed)
-    current = random_board(n, rng)
-    current_h = H(current)
-    best = current[:]
-    best_h = current_h
+    current = Board(random_board(n, rng))
+    best = current.rows[:]
+    best_h = current.h
     states = 1
     start = time.time()
     T = T0
-    history = [current_h] if return_history else None
+    history = [current.h] if return_history else None
     while states < max_states and T > Tmin and best_h > 0:
-        candidate = neighbors_for_sa(current, rng)
-        cand_h = H(candidate)
-        delta = cand_h - current_h
+        # mismo vecino que neighbors_for_sa (columna y fila al azar), evaluado en O(1)
+        c = rng.randrange(n)
+        r = rng.randrange(n)
+        delta = current.delta(c, r)
         if delta <= 0 or rng.random() < math.exp(-delta / T):
-            current, current_h = candidate, cand_h
-            if current_h < best_h:
-                best, best_h = current[:], current_h
+            current.move(c, r)
+            if current.h < best_h:
+                best, best_h = current.rows[:], current.h
         T *= alpha
         states += 1
         if return_history:
-            history.append(current_h)
+            history.append(current.h)
     elapsed = time.time() - start
     return best, best_h, states, elapsed, (history if return_history else None)
 
@@ -194,6 +292,200 @@ def genetic_algorithm(n, max_states, seed, pop_size=100, k_tourn=3, pc=0.9, pm=0
     elapsed = time.time() - start
     return best_ind, best_h, evals, elapsed, (history if return_history else None)
 
+# --- GA con la población en un array (P, n) ---
+def batch_H(pop):
+    # H de cada fila de pop: C(k, 2) por fila y diagonal, con un bincount por tipo de línea
+    P, n = pop.shape
+    cols = np.arange(n)
+    h = np.zeros(P, dtype=np.int64)
+    for lines, size in ((pop, n), (pop - cols + n - 1, 2 * n - 1), (pop + cols, 2 * n - 1)):
+        ids = lines + (np.arange(P)[:, None] * size)
+        cnt = np.bincount(ids.ravel(), minlength=P * size).reshape(P, size)
+        h += (cnt * (cnt - 1) // 2).sum(axis=1)
+    return h
+
+def tournament_np(h, size, k, rng):
+    # `size` torneos de k individuos distintos; gana el de menor H
+    P = len(h)
+    idx = rng.integers(0, P, size=(size, k))
+    if 1 < k <= P:
+        while True:
+            srt = np.sort(idx, axis=1)
+            dup = (srt[:, 1:] == srt[:, :-1]).any(axis=1)
+            if not dup.any():
+                break
+            idx[dup] = rng.integers(0, P, size=(int(dup.sum()), k))
+    return idx[np.arange(size), h[idx].argmin(axis=1)]
+
+def genetic_algorithm_np(n, max_states, seed, pop_size=100, k_tourn=3, pc=0.9, pm=0.1, elitism=2, return_history=False):
+    # mismo esquema que genetic_algorithm (torneo, cruce uniforme, mutación por gen,
+    # elitismo, presupuesto en evaluaciones), pero cada generación en operaciones
+    # sobre toda la población; reproducible por semilla (np.random.default_rng)
+    rng = np.random.default_rng(seed)
+    pop = rng.integers(0, n, size=(pop_size, n), dtype=np.int32)
+    h = batch_H(pop)
+    evals = pop_size
+    b = int(h.argmin())
+    best_ind, best_h = pop[b].tolist(), int(h[b])
+    start = time.time()
+    history = [best_h] if return_history else None
+    n_children = pop_size - elitism
+    while evals < max_states and best_h > 0:
+        elite = np.argpartition(h, elitism - 1)[:elitism] if elitism > 0 else np.zeros(0, dtype=np.int64)
+        # como en la versión original, se corta en medio de la generación si se acaba el presupuesto
+        pairs = min((n_children + 1) // 2, (max_states - evals + 1) // 2)
+        parents = pop[tournament_np(h, 2 * pairs, k_tourn, rng)]
+        p1, p2 = parents[0::2], parents[1::2]
+        swap = (rng.random((pairs, n)) < 0.5) & (rng.random(pairs) < pc)[:, None]
+        children = np.concatenate([np.where(swap, p2, p1), np.where(swap, p1, p2)])
+        mut = rng.random(children.shape) < pm
+        children[mut] = rng.integers(0, n, size=int(mut.sum()), dtype=np.int32)
+        children = children[:n_children]
+        evals += 2 * pairs
+        pop = np.concatenate([pop[elite], children])
+        h = np.concatenate([h[elite], batch_H(children)])
+        b = int(h.argmin())
+        if h[b] < best_h:
+            best_ind, best_h = pop[b].tolist(), int(h[b])
+        if return_history:
+            history.append(best_h)
+    elapsed = time.time() - start
+    return best_ind, best_h, evals, elapsed, (history if return_history else None)
+
+# --- Min-conflicts ---
+MC_TRIES = 64         # filas libres que prueba la inicialización greedy por columna
+MC_SCAN_N = 1000      # hasta este N se revisan todas las filas; si no, MC_SAMPLES al azar
+MC_SAMPLES = 64
+MC_NOISE = 0.05       # prob. de un swap al azar aunque haya uno que no empeore (plateaus)
+
+def greedy_board(n, rng, tries=MC_TRIES):
+    # cada columna toma una fila todavía sin usar (sin conflictos de fila) y,
+    # entre hasta `tries` candidatas al azar, la primera sin conflictos diagonales
+    d1_cnt = [0] * (2 * n - 1)
+    d2_cnt = [0] * (2 * n - 1)
+    free = list(range(n))
+    board = [0] * n
+    rand = rng.random    # int(rand() * m) en vez de randrange: este loop corre n veces
+    for c in range(n):
+        m = n - c
+        best_i, best_v = 0, n
+        for _ in range(min(tries, m)):
+            i = int(rand() * m)
+            r = free[i]
+            v = d1_cnt[r - c + n - 1] + d2_cnt[r + c]
+            if v < best_v:
+                best_i, best_v = i, v
+                if v == 0:
+                    break
+        r = free[best_i]
+        free[best_i] = free[m - 1]
+        free.pop()
+        board[c] = r
+        d1_cnt[r - c + n - 1] += 1
+        d2_cnt[r + c] += 1
+    return board
+
+def attacked(state, c):
+    r, n = state.rows[c], state.n
+    return state.row_cnt[r] + state.d1_cnt[r - c + n - 1] + state.d2_cnt[r + c] > 3
+
+def swap_delta(state, c, j):
+    # cambio de H al intercambiar las filas de las columnas c y j (O(1))
+    rc, rj = state.rows[c], state.rows[j]
+    d = state.delta(c, rj)
+    state.move(c, rj)
+    d += state.delta(j, rc)
+    state.move(c, rc)
+    return d
+
+def min_conflicts(n, max_states, seed, return_history=False):
+    # reparación por min-conflicts con intercambios: el tablero greedy es una
+    # permutación y los swaps la mantienen, así que solo hay choques diagonales
+    rng = random.Random(seed)
+    start = time.time()
+    state = Board(greedy_board(n, rng))
+    rows, d1_cnt, d2_cnt = state.rows, state.d1_cnt, state.d2_cnt
+    # suma de columnas por diagonal: si tiene 2 reinas, la otra es suma - c
+    d1_sum, d2_sum = [0] * (2 * n - 1), [0] * (2 * n - 1)
+    for c, r in enumerate(rows):
+        d1_sum[r - c + n - 1] += c
+        d2_sum[r + c] += c
+    # columnas atacadas (puede tener repetidas o ya resueltas: se filtran al sacarlas)
+    conflicted = [c for c in range(n) if attacked(state, c)]
+
+    def place(c, r):
+        r0 = rows[c]
+        d1_sum[r0 - c + n - 1] -= c
+        d2_sum[r0 + c] -= c
+        state.move(c, r)
+        k1, k2 = r - c + n - 1, r + c
+        d1_sum[k1] += c
+        d2_sum[k2] += c
+        # quien comparte diagonal con c queda atacado; con 3+ reinas ya lo estaba
+        if d1_cnt[k1] == 2:
+            conflicted.append(d1_sum[k1] - c)
+        if d2_cnt[k2] == 2:
+            conflicted.append(d2_sum[k2] - c)
+
+    states = 1
+    history = [state.h] if return_history else None
+    while states < max_states and state.h > 0:
+        i = rng.randrange(len(conflicted))
+        c = conflicted[i]
+        conflicted[i] = conflicted[-1]
+        conflicted.pop()
+        if not attacked(state, c):
+            continue
+        cands = range(n) if n <= MC_SCAN_N else [rng.randrange(n) for _ in range(MC_SAMPLES)]
+        best_d, bests = None, []
+        for j in cands:
+            if j == c:
+                continue
+            d = swap_delta(state, c, j)
+            if best_d is None or d < best_d:
+                best_d, bests = d, [j]
+            elif d == best_d:
+                bests.append(j)
+        # mínimo local (todo swap empeora) o paso de ruido: swap al azar para salir
+        if best_d <= 0 and rng.random() >= MC_NOISE:
+            j = rng.choice(bests)
+        else:
+            j = (c + 1 + rng.randrange(n - 1)) % n
+        rc, rj = rows[c], rows[j]
+        place(c, rj)
+        place(j, rc)
+        if attacked(state, c):
+            conflicted.append(c)
+        if attacked(state, j):
+            conflicted.append(j)
+        states += 1
+        if return_history:
+            history.append(state.h)
+    elapsed = time.time() - start
+    return state.rows, state.h, states, elapsed, (history if return_history else None)
+
+def mc_scaling(sizes, seeds, max_states, out_csv, out_png):
+    # tiempo de min_conflicts según N (incluye la inicialización greedy)
+    rows = []
+    for n in sizes:
+        for seed in seeds:
+            _, hval, states, t, _ = min_conflicts(n, max_states, seed)
+            rows.append(["MC", seed, n, hval, states, f"{t:.6f}"])
+            print(f"N={n} seed={seed}: H={hval} states={states} time={t:.3f}s")
+    with open(out_csv, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["algorithm_name","seed","size","H","states","time"])
+        w.writerows(rows)
+    means = [stats_summary([float(r[5]) for r in rows if r[2] == n])[0] for n in sizes]
+    plt.figure()
+    plt.loglog(sizes, means, marker="o")
+    plt.xlabel("N")
+    plt.ylabel("Tiempo [s]")
+    plt.title("Min-conflicts: tiempo vs N")
+    plt.tight_layout()
+    plt.savefig(out_png)
+    plt.close()
+
 def write_csv(rows, csv_path):
     header = ["algorithm_name","env_n","size","best_solution","H","states","time"]
     with open(csv_path, "w", newline="") as f:
@@ -230,28 +522,31 @@ def boxplot_metric(data_by_algo, ylabel, title, out_path):
     plt.savefig(out_path)
     plt.close()
 
-def run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag):
+def run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag, ga_engine="numpy"):
     if alg == "HC":
         return hill_climbing(n, max_states, seed, return_history=history_flag)
     if alg == "SA":
         return simulated_annealing(n, max_states, seed, T0=sa_T0, alpha=sa_alpha, Tmin=sa_Tmin, return_history=history_flag)
     if alg == "GA":
-        return genetic_algorithm(n, max_states, seed, pop_size=ga_pop, k_tourn=ga_k, pc=ga_pc, pm=ga_pm, elitism=ga_elitism, return_history=history_flag)
+        ga = genetic_algorithm_np if ga_engine == "numpy" else genetic_algorithm
+        return ga(n, max_states, seed, pop_size=ga_pop, k_tourn=ga_k, pc=ga_pc, pm=ga_pm, elitism=ga_elitism, return_history=history_flag)
     if alg == "random":
         return random_search(n, max_states, seed, return_history=history_flag)
+    if alg == "MC":
+        return min_conflicts(n, max_states, seed, return_history=history_flag)
     raise ValueError("unknown algorithm")
 
-def experiments(seeds, sizes, max_states, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism):
+def experiments(seeds, sizes, max_states, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, ga_engine="numpy"):
     base = project_root()
     images_dir = base / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
     csv_path = base / "tp4-Nreinas.csv"
     rows = []
-    algos = ["random","HC","SA","GA"]
+    algos = ["random","HC","SA","GA","MC"]
     for n in sizes:
         for env_n, seed in enumerate(seeds, start=1):
             for alg in algos:
-                b, hval, states, t, _ = run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag=False)
+                b, hval, states, t, _ = run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag=False, ga_engine=ga_engine)
                 rows.append([alg, env_n, n, b, hval, states, f"{t:.6f}"])
     write_csv(rows, csv_path)
     agg = {}
@@ -272,10 +567,10 @@ def experiments(seeds, sizes, max_states, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k
         boxplot_metric(data_h, "H(e)", f"H por algoritmo (N={n})", images_dir / f"boxplot_H_N{n}.png")
         boxplot_metric(data_t, "Tiempo [s]", f"Tiempo por algoritmo (N={n})", images_dir / f"boxplot_time_N{n}.png")
         boxplot_metric(data_s, "Estados", f"Estados por algoritmo (N={n})", images_dir / f"boxplot_states_N{n}.png")
-    for alg in ["random","HC","SA","GA"]:
+    for alg in algos:
         seed = seeds[0]
         n = sizes[0]
-        b, hval, states, t, hist = run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag=True)
+        b, hval, states, t, hist = run_single(alg, n, max_states, seed, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k, ga_pc, ga_pm, ga_elitism, history_flag=True, ga_engine=ga_engine)
         if hist and len(hist)>1:
             plot_history(hist, f"Evolución H(e) {alg} (N={n}, seed={seed})", images_dir / f"history_{alg}_N{n}_seed{seed}.png")
     reporte_md = base / "tp4-reporte.md"
@@ -293,8 +588,8 @@ def experiments(seeds, sizes, max_states, sa_T0, sa_alpha, sa_Tmin, ga_pop, ga_k
 
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument("--mode", choices=["single","exp"], default="single")
-    p.add_argument("--alg", choices=["random","HC","SA","GA"], default="HC")
+    p.add_argument("--mode", choices=["single","exp","mc_scaling"], default="single")
+    p.add_argument("--alg", choices=["random","HC","SA","GA","MC"], default="HC")
     p.add_argument("--n", type=int, default=8)
     p.add_argument("--max_states", type=int, default=10000)
     p.add_argument("--seed", type=int, default=0)
@@ -306,11 +601,13 @@ def main():
     p.add_argument("--ga_pc", type=float, default=0.9)
     p.add_argument("--ga_pm", type=float, default=0.1)
     p.add_argument("--ga_elitism", type=int, default=2)
+    p.add_argument("--ga_engine", choices=["numpy","python"], default="numpy",
+                   help="numpy: población como array (P, n); python: versión original con listas")
     p.add_argument("--history", action="store_true")
     args = p.parse_args()
 
     if args.mode == "single":
-        b, hval, states, t, hist = run_single(args.alg, args.n, args.max_states, args.seed, args.sa_T0, args.sa_alpha, args.sa_Tmin, args.ga_pop, args.ga_k, args.ga_pc, args.ga_pm, args.ga_elitism, args.history)
+        b, hval, states, t, hist = run_single(args.alg, args.n, args.max_states, args.seed, args.sa_T0, args.sa_alpha, args.sa_Tmin, args.ga_pop, args.ga_k, args.ga_pc, args.ga_pm, args.ga_elitism, args.history, args.ga_engine)
         print("algorithm_name:", args.alg)
         print("solution:", b)
         print("H:", hval)
@@ -323,10 +620,18 @@ def main():
             outp = img / f"history_{args.alg}_N{args.n}_seed{args.seed}.png"
             plot_history(hist, f"Evolución H(e) {args.alg} (N={args.n}, seed={args.seed})", outp)
             print("history_plot:", str(outp))
+    elif args.mode == "mc_scaling":
+        base = project_root()
+        (base / "images").mkdir(parents=True, exist_ok=True)
+        sizes = [10**k for k in range(2, 7)]
+        out_csv, out_png = base / "tp4-mc-scaling.csv", base / "images" / "mc_scaling.png"
+        mc_scaling(sizes, list(range(1, 4)), args.max_states, out_csv, out_png)
+        print("csv:", out_csv)
+        print("plot:", out_png)
     else:
         seeds = list(range(1, 30 + 1))
         sizes = [4, 8, 10]
-        csv_path, reporte_md, images_dir = experiments(seeds, sizes, args.max_states, args.sa_T0, args.sa_alpha, args.sa_Tmin, args.ga_pop, args.ga_k, args.ga_pc, args.ga_pm, args.ga_elitism)
+        csv_path, reporte_md, images_dir = experiments(seeds, sizes, args.max_states, args.sa_T0, args.sa_alpha, args.sa_Tmin, args.ga_pop, args.ga_k, args.ga_pc, args.ga_pm, args.ga_elitism, args.ga_engine)
         print("csv:", csv_path)
         print("reporte_md:", reporte_md)
         print("images_dir:", images_dir)